@@ -1,9 +1,7 @@
 """The definitions of all engines running the query enrichment."""
 
-import json
 import logging
-from copy import deepcopy
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import Dict, List, Optional, Protocol, runtime_checkable
 
 from SPARQLBurger.SPARQLQueryBuilder import SPARQLGraphPattern, SPARQLSelectQuery
 from SPARQLBurger.SPARQLSyntaxTerms import Prefix, Triple
@@ -17,6 +15,7 @@ from enhanced_search.annotation import (
 )
 from enhanced_search.annotation.utils import prepare_value_for_sparql
 from enhanced_search.databases.graph import KnowledgeDatabase
+from enhanced_search.utils import load_json
 
 logger = logging.getLogger(__file__)
 
@@ -78,7 +77,7 @@ class SparqlSemanticEngine:
         return self._generate_result(query, data, taxon_variable_name)
 
     def _extract_data_from_response(self, db_response_string: str) -> dict:
-        data = json.loads(db_response_string)
+        data = load_json(db_response_string)
         return data["results"]["bindings"]
 
     def _generate_result(self, query: Query, data: dict, taxon_name: str) -> dict:
@@ -149,7 +148,7 @@ class SparqlQueryGenerator:
         main_pattern = SPARQLGraphPattern()
         select_pattern.set_where_pattern(main_pattern)
 
-        for index, statement in enumerate(deepcopy(statements)):
+        for index, statement in enumerate(self._deduplicate_statements(statements)):
             is_optional = index > 0
             pattern = SPARQLGraphPattern(optional=is_optional)
             self._add_taxon_triple(pattern, variable_name, statement)
@@ -164,6 +163,15 @@ class SparqlQueryGenerator:
 
         return select_query_string
 
+    def _deduplicate_statements(self, statements: List[Statement]) -> List[Statement]:
+        """Removes equal statements, since they only repeat the same graph pattern.
+        The order of the remaining statements is kept."""
+        unique_statements: Dict[tuple, Statement] = {}
+        for statement in statements:
+            unique_statements.setdefault(_get_statement_key(statement), statement)
+
+        return list(unique_statements.values())
+
     def _setup_select_query(self, namespaces: dict) -> SPARQLSelectQuery:
         select_query = SPARQLSelectQuery(distinct=True)
 
@@ -193,7 +201,7 @@ class SparqlQueryGenerator:
             subject_variable_name = prepare_value_for_sparql(statement.subject)
         else:
             subjects = " ".join(
-                prepare_value_for_sparql(uri) for uri in statement.subject
+                [prepare_value_for_sparql(uri) for uri in statement.subject]
             )
             taxon_values = Triple(
                 subject="VALUES",
@@ -227,7 +235,7 @@ class SparqlQueryGenerator:
 
         if predicates is not None:
             predicate_values = " ".join(
-                prepare_value_for_sparql(uri) for uri in predicates
+                [prepare_value_for_sparql(uri) for uri in predicates]
             )
 
             value_triple = Triple(
@@ -249,7 +257,7 @@ class SparqlQueryGenerator:
                 values_variable_name = prepare_value_for_sparql(values)
             elif len(values) > 1:
                 values_string = " ".join(
-                    prepare_value_for_sparql(uri) for uri in values
+                    [prepare_value_for_sparql(uri) for uri in values]
                 )
 
                 value_triple = Triple(
@@ -259,7 +267,7 @@ class SparqlQueryGenerator:
                 )
                 pattern.add_triples([value_triple])
             else:
-                values_variable_name = prepare_value_for_sparql(values.pop())
+                values_variable_name = prepare_value_for_sparql(next(iter(values)))
 
             trait_retrieval_triple_by_object = Triple(
                 subject=trait_variable_name,
@@ -274,3 +282,16 @@ class SparqlQueryGenerator:
             object=trait_variable_name,
         )
         pattern.add_triples([triple])
+
+
+def _get_statement_key(statement: Statement) -> tuple:
+    """Returns a hashable representation of the given statement."""
+    return tuple(
+        frozenset(value) if isinstance(value, set) else value
+        for value in (
+            statement.subject,
+            statement.predicate,
+            statement.object,
+            statement.relationship,
+        )
+    )
@@ -1,5 +1,6 @@
 """Provides processors that can enrich Query objects semantically."""
 
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Set, Union
 
 from enhanced_search import configuration as config
@@ -88,6 +89,10 @@ class SemanticQueryProcessor:
         if self.semantic_engine_name is None:
             raise ValueError("The Semantic Engine is not set! Operation not possible!")
 
+        # Without any annotations or statements there is nothing to resolve
+        if not query.statements and not query.annotations:
+            return False
+
         engine_factory = SemanticEngineFactory()
         semantic_engine = engine_factory.create(self.semantic_engine_name)
         additional_annotation_data = semantic_engine.generate_query_semantics(
@@ -276,4 +281,4 @@ def freeze_key(set_to_freeze: Union[Set[Uri], Uri, LiteralString]) -> tuple:
     if isinstance(set_to_freeze, (Uri, LiteralString)):
         return (set_to_freeze,)
 
-    return tuple(sorted(set_to_freeze, key=lambda a: a.url))
+    return tuple(sorted(set_to_freeze, key=attrgetter("url")))
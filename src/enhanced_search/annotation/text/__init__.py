@@ -4,6 +4,7 @@ from copy import copy
 from typing import Dict, List, Optional
 
 from enhanced_search.annotation import Annotation, AnnotationResult
+from enhanced_search.annotation.utils import get_begin
 
 from .engines import AnnotationEngine
 
@@ -60,4 +61,4 @@ def update_annotations_with_disambiguated_annotations(
 
     annotations.extend(disambiguations.values())
 
-    return sorted(annotations, key=lambda ann: ann.begin)
+    return sorted(annotations, key=get_begin)
@@ -41,14 +41,21 @@ class Pattern(ABC):
         Returns a list of dictionaries, each holding context data of a single
         match within the text. If no match was found, the list is empty.
         """
+        abstracted_matching_string = convert_text_to_abstracted_string(
+            text, annotations, literals
+        )
+
+        return self.match_abstracted_string(abstracted_matching_string)
+
+    def match_abstracted_string(self, abstracted_matching_string: str) -> List[dict]:
+        """Like `match`, but takes the text already abstracted by
+        `convert_text_to_abstracted_string`.
+        """
         if self.regex_pattern is None:
             raise NotImplementedError(
                 "You did not provide a `regex_pattern` variable for this class!"
             )
 
-        abstracted_matching_string = convert_text_to_abstracted_string(
-            text, annotations, literals
-        )
         matches = self.regex_pattern.search(abstracted_matching_string)
 
         additional_data = self.additional_data
@@ -155,12 +162,13 @@ class PatternDependencyAnnotationEngine:
         """
         statements = []
 
+        # All patterns match against the same abstracted text, so it is created once
+        abstracted_matching_string = convert_text_to_abstracted_string(
+            text, annotation_result.named_entity_recognition, annotation_result.literals
+        )
+
         for pattern in self.patterns:
-            statements = pattern.match(
-                text=text,
-                annotations=annotation_result.named_entity_recognition,
-                literals=annotation_result.literals,
-            )
+            statements = pattern.match_abstracted_string(abstracted_matching_string)
             if statements:
                 break
 
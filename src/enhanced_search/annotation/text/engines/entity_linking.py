@@ -1,12 +1,13 @@
 """Provides AnnotationEngines for linking Named Entities with their respective URI."""
 
-import json
-from typing import Optional
+from itertools import chain
+from typing import Callable, List, Optional, Union
 
 from enhanced_search.annotation import Annotation, AnnotationResult, Uri
 from enhanced_search.annotation.text.utils import (
     convert_annotation_string_to_named_entity_type,
     get_word_text_and_lemma_set,
+    parse_annotation_data,
 )
 from enhanced_search.databases.key_value import KeyValueDatabase
 
@@ -32,11 +33,17 @@ class UriLinkerAnnotatorEngine:
             }
          }
 
+    If the database provides a `read_many` method, the data of all Annotations is
+    read in a single batch. Otherwise, the Annotations are read one after another.
+
     Obeys the AnnotatorEngine interface!
     """
 
     def __init__(self, db: KeyValueDatabase):
         self._db = db
+        self._read_many: Optional[
+            Callable[[List[str]], List[Optional[Union[str, dict]]]]
+        ] = getattr(db, "read_many", None)
 
     def parse(self, _: str, annotation_result: AnnotationResult) -> None:
         """Adds URIs from a database to each annotation, if possible.
@@ -48,12 +55,14 @@ class UriLinkerAnnotatorEngine:
         if annotation_result.named_entity_recognition is None:
             raise ValueError("No annotation data is provided!")
 
-        linked_uri_data: dict = {}
-        for annotation in annotation_result.named_entity_recognition:
-            corresponding_data = self._get_data_for_annotation_text(annotation)
+        annotations = annotation_result.named_entity_recognition
 
+        linked_uri_data: dict = {}
+        for annotation, corresponding_data in zip(
+            annotations, self._get_data_for_annotations(annotations)
+        ):
             if corresponding_data is not None:
-                annotation_data = json.loads(corresponding_data)
+                annotation_data = parse_annotation_data(corresponding_data)
 
                 self._update_linked_uri_data(
                     linked_uri_data, annotation, annotation_data
@@ -80,7 +89,50 @@ class UriLinkerAnnotatorEngine:
 
         linked_uri_data[annotation.id] = update_uri_data
 
-    def _get_data_for_annotation_text(self, annotation: Annotation) -> Optional[str]:
+    def _get_data_for_annotations(
+        self, annotations: List[Annotation]
+    ) -> List[Optional[Union[str, dict]]]:
+        """Reads the data of all Annotations from the database. The order of the
+        returned data corresponds to the order of the given Annotations.
+        """
+        if self._read_many is not None:
+            return self._read_data_for_annotations_in_batch(
+                annotations, self._read_many
+            )
+
+        return [self._get_data_for_annotation_text(ann) for ann in annotations]
+
+    @staticmethod
+    def _read_data_for_annotations_in_batch(
+        annotations: List[Annotation],
+        read_many: Callable[[List[str]], List[Optional[Union[str, dict]]]],
+    ) -> List[Optional[Union[str, dict]]]:
+        test_strings_per_annotation = [
+            [test_string.lower() for test_string in get_word_text_and_lemma_set(ann)]
+            for ann in annotations
+        ]
+        unique_test_strings = list(
+            dict.fromkeys(chain.from_iterable(test_strings_per_annotation))
+        )
+        data_per_test_string = dict(
+            zip(unique_test_strings, read_many(unique_test_strings))
+        )
+
+        return [
+            next(
+                (
+                    data_per_test_string[test_string]
+                    for test_string in test_strings
+                    if data_per_test_string[test_string] is not None
+                ),
+                None,
+            )
+            for test_strings in test_strings_per_annotation
+        ]
+
+    def _get_data_for_annotation_text(
+        self, annotation: Annotation
+    ) -> Optional[Union[str, dict]]:
         for test_string in get_word_text_and_lemma_set(annotation):
             corresponding_data = self._db.read(test_string.lower())
             if corresponding_data is not None:
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 from enhanced_search import configuration
-from enhanced_search.annotation import Annotation, AnnotationResult, Word
+from enhanced_search.annotation import (
+    Annotation,
+    AnnotationResult,
+    LiteralString,
+    Word,
+)
 from enhanced_search.databases.key_value import KeyValueDatabase
 
 from ..utils import update_annotation_with_data
@@ -17,6 +22,10 @@ class StringBasedNamedEntityAnnotatorEngine:
     No further semantics are extracted. Hence, URIs are NOT linked to the respective
     Annotation object. For adding URIs, parse the Annotation to an URI-Linker.
 
+    If the given database provides a `has_keys_with_prefix` method, the extension
+    of a token with its following tokens stops as soon as no key in the database
+    starts with the extended text.
+
     Obeys the AnnotatorEngine interface!
     """
 
@@ -25,6 +34,7 @@ class StringBasedNamedEntityAnnotatorEngine:
 
     def __init__(self, db: KeyValueDatabase):
         self._db = db
+        self._has_keys_with_prefix = getattr(db, "has_keys_with_prefix", None)
 
     def parse(self, _: str, annotation_result: AnnotationResult) -> None:
         """Provide the text and the current state (the AnnotationResult) of
@@ -34,7 +44,13 @@ class StringBasedNamedEntityAnnotatorEngine:
         retrieved_annotations = []
         last_annotation_position = -1
 
-        for index, token in enumerate(annotation_result.tokens):
+        tokens = annotation_result.tokens
+        # The extension loop only needs the strings of the tokens. Reading them from
+        # lists avoids the creation of a Word object for every extension.
+        token_texts = [token.text for token in tokens]
+        token_lemmas = [token.lemma for token in tokens]
+
+        for index, token in enumerate(tokens):
             if (
                 not is_token_valid(token)
                 or token.begin <= last_annotation_position <= token.end
@@ -43,36 +59,66 @@ class StringBasedNamedEntityAnnotatorEngine:
 
             inferenced_text, corresponding_data = self._get_data_for_token(token)
 
-            annotation_data = []
+            # Only the longest match is relevant, hence no need to collect all matches
+            best_match: Optional[Tuple[Word, Union[str, dict]]] = None
             if corresponding_data is not None and inferenced_text is not None:
-                annotation_data.append((token, corresponding_data))
+                best_match = (token, corresponding_data)
 
             # Quoted strings should be taken as encapsulated entities
             if not token.is_quoted:
-                inferenced_token = token
-                for following_token in annotation_result.tokens[index + 1 :]:
-                    inferenced_token = inferenced_token + following_token
-
-                    # Always query with lemma, because otherwise multi-token texts will
-                    # return empty.
-                    if inferenced_token.lemma is not None:
-                        extended_word_data = self._db.read(
-                            inferenced_token.lemma.lower()
-                        )
-                        if extended_word_data is not None:
-                            annotation_data.append(
-                                (inferenced_token, extended_word_data)
-                            )
-
-            if annotation_data:
-                inferenced_token, data = annotation_data[-1]
-                ann = self._create_annotation(inferenced_token, data)
+                extended_match = self._get_data_for_extended_token(
+                    index, tokens, token_texts, token_lemmas
+                )
+                if extended_match is not None:
+                    best_match = extended_match
+
+            if best_match is not None:
+                ann = self._create_annotation(*best_match)
                 last_annotation_position = ann.end
                 retrieved_annotations.append(ann)
 
         annotation_result.named_entity_recognition = retrieved_annotations
 
-    def _get_data_for_token(self, token: Word) -> Tuple[Optional[str], Optional[str]]:
+    def _get_data_for_extended_token(
+        self,
+        index: int,
+        tokens: List[LiteralString],
+        token_texts: List[str],
+        token_lemmas: List[Optional[str]],
+    ) -> Optional[Tuple[Word, Union[str, dict]]]:
+        """Extends the token at `index` successively with its following tokens and
+        returns the longest extension found in the database together with its data.
+        A Word object is only created for extensions that are found in the database.
+        """
+        longest_match = None
+        extended_text = token_texts[index]
+        extended_lemma = token_lemmas[index]
+
+        for following_index in range(index + 1, len(tokens)):
+            extended_text = f"{extended_text} {token_texts[following_index]}"
+            extended_lemma = f"{extended_lemma} {token_lemmas[following_index]}"
+
+            # Always query with lemma, because otherwise multi-token texts will
+            # return empty.
+            lowered_lemma = extended_lemma.lower()
+            if not self._is_prefix_of_any_key(lowered_lemma):
+                break
+
+            extended_word_data = self._db.read(lowered_lemma)
+            if extended_word_data is not None:
+                extended_word = Word(
+                    begin=tokens[index].begin,
+                    end=tokens[following_index].end,
+                    text=extended_text,
+                    lemma=extended_lemma,
+                )
+                longest_match = (extended_word, extended_word_data)
+
+        return longest_match
+
+    def _get_data_for_token(
+        self, token: Word
+    ) -> Tuple[Optional[str], Optional[Union[str, dict]]]:
         # Always test the original text first!
         strings = [string for string in [token.text, token.lemma] if string is not None]
 
@@ -84,10 +130,19 @@ class StringBasedNamedEntityAnnotatorEngine:
 
         return None, None
 
+    def _is_prefix_of_any_key(self, text: str) -> bool:
+        """Returns False only if the database guarantees that no key starts with
+        the given text. Without a prefix lookup in the database, True is returned.
+        """
+        if self._has_keys_with_prefix is None:
+            return True
+
+        return self._has_keys_with_prefix(text)
+
     def _create_annotation(
         self,
         token: Word,
-        annotation_data: str,
+        annotation_data: Union[str, dict],
     ):
         annotation = Annotation(
             begin=token.begin, end=token.end, text=token.text, lemma=token.lemma
@@ -1,9 +1,15 @@
 """Provides AnnotationEngines for tokenizing a given text."""
 
-from typing import List
+import re
+from typing import List, Optional
 
 from enhanced_search.annotation import AnnotationResult, LiteralString, Word
-from enhanced_search.annotation.text.utils import tokenize_text
+
+# Splits a text on whitespaces, but keeps quoted strings (including the quotation
+# marks) together. This resembles the behaviour of `shlex.split(text, posix=False)`.
+# A lone quotation mark that is not closed is matched separately to raise an error.
+TOKEN_PATTERN = re.compile(r"\"[^\"]*\"|'[^']*'|[\"']|[^ \t\r\n]+")
+QUOTATION_CHARACTERS = ('"', "'")
 
 
 class SimpleTokenizer:
@@ -17,22 +23,7 @@ class SimpleTokenizer:
 
     def parse(self, text: str, annotation_result: AnnotationResult) -> None:
         """Tokenizes the given text and adds it to the AnnotationResult."""
-        tokens = tokenize_text(text, keep_quotations=True)
-        tokens = self._filter_tokens(tokens)
-        words = tokens_to_literal_string_objects(tokens, text)
-
-        annotation_result.tokens = words
-
-    def _filter_tokens(self, tokens: List[str]) -> List[str]:
-        filters = [remove_punctuation_marks]
-
-        updated_tokens = []
-        for token in tokens:
-            for f in filters:
-                token = f(token)
-            updated_tokens.append(token)
-
-        return updated_tokens
+        annotation_result.tokens = text_to_literal_string_objects(text)
 
 
 def remove_punctuation_marks(token: str) -> str:
@@ -42,6 +33,34 @@ def remove_punctuation_marks(token: str) -> str:
     return token.strip("!?;")
 
 
+def text_to_literal_string_objects(text: Optional[str]) -> List[LiteralString]:
+    """Splits the given text into LiteralStrings in a single pass.
+    Punctuation marks are removed from the tokens and quoted tokens are marked as
+    such.
+
+    Raises:
+        ValueError: If the text contains a quotation that is not closed.
+    """
+    if text is None:
+        return []
+
+    literals = []
+    for match in TOKEN_PATTERN.finditer(text):
+        raw_token = match.group()
+        if raw_token in QUOTATION_CHARACTERS:
+            raise ValueError("No closing quotation")
+
+        token = remove_punctuation_marks(raw_token)
+        token_start = match.start() + raw_token.index(token)
+        literal = LiteralString(
+            begin=token_start, end=token_start + len(token), text=token
+        )
+        word_quotation_check(literal)
+        literals.append(literal)
+
+    return literals
+
+
 def tokens_to_literal_string_objects(
     tokens: List[str], text: str
 ) -> List[LiteralString]:
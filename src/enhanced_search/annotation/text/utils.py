@@ -1,12 +1,13 @@
 """Some handy methods that are shared between multiple moduless."""
 
-import json
 import shlex
 from copy import deepcopy
-from typing import Generator, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Generator, List, Optional, Set, Tuple, Union
 
 from enhanced_search import configuration as config
 from enhanced_search.annotation import Annotation, NamedEntityType, Word
+from enhanced_search.utils import load_json
 
 named_entity_mapping = {
     config.PLANT_ANNOTATION_STRING.lower(): NamedEntityType.PLANT,
@@ -21,11 +22,14 @@ named_entity_mapping = {
 }
 
 
+@lru_cache(maxsize=128)
 def convert_annotation_string_to_named_entity_type(
     annotation_string: str,
 ) -> NamedEntityType:
     """Takes a string (e.g. "Plant_Flora") and retrieves the corresponding
     NamedEntityType.
+
+    The number of distinct annotation strings is small, hence the results are cached.
     """
     number_of_expected_named_entity_types = 5
 
@@ -53,12 +57,18 @@ named_entity_priority = [
 ]
 
 
+named_entity_priority_index = {
+    named_entity_type: priority
+    for priority, named_entity_type in enumerate(named_entity_priority)
+}
+
+
 def sort_named_entities_by_priority(named_entity_type_string: str) -> int:
     """A custom sorting algorithm for NamedEntityTypes."""
 
-    return named_entity_priority.index(
+    return named_entity_priority_index[
         convert_annotation_string_to_named_entity_type(named_entity_type_string)
-    )
+    ]
 
 
 def tokenize_text(text: Optional[str], keep_quotations: bool = False) -> List[str]:
@@ -109,10 +119,22 @@ def get_word_text_and_lemma_set(word: Word) -> Set[str]:
     return {string for string in {word.text, word.lemma} if string is not None}
 
 
+def parse_annotation_data(annotation_data: Union[str, bytes, dict]) -> dict:
+    """Returns the given annotation data as dictionary.
+    Databases may return the data as JSON string or already parsed. Parsed data is
+    returned unchanged.
+    """
+    if isinstance(annotation_data, dict):
+        return annotation_data
+
+    return load_json(annotation_data)
+
+
 def update_annotation_with_data(
-    annotation: Annotation, json_string_data: str
+    annotation: Annotation, annotation_data: Union[str, dict]
 ) -> Annotation:
     """Updates the given Annotation with the given data.
+    The data can be given as JSON string or as already parsed dictionary.
     Example data:
         '{"Plant_Flora":
         [["https://www.biofid.de/bio-ontologies/Tracheophyta#GBIF_2874875", 3]
@@ -123,13 +145,12 @@ def update_annotation_with_data(
         named_entity_type2: [[uri_string2, position_in_a_triple]
         ...}
     """
-    json_data = json.loads(json_string_data)
+    json_data = parse_annotation_data(annotation_data)
 
     original_annotation = annotation
     counter = 0
     for named_entity_type_string in sorted(
-        json_data.keys(),
-        key=lambda item_key: sort_named_entities_by_priority(item_key),
+        json_data.keys(), key=sort_named_entities_by_priority
     ):
         if counter != 0:
             annotation = deepcopy(original_annotation)
@@ -1,9 +1,24 @@
 """Some handy methods that are useful in several places within the package."""
 
+import re
+from operator import attrgetter
 from typing import List, Union
 
 from enhanced_search.annotation import Annotation, LiteralString, Uri
-from enhanced_search.utils import escape_characters
+from enhanced_search.utils import create_escape_translation_table
+
+get_begin = attrgetter("begin")
+
+# Matches the lexical space of xsd:integer (ASCII digits only)
+INTEGER_PATTERN = re.compile(r"[+-]?[0-9]+")
+
+SPARQL_INPUT_ESCAPE_CHARACTERS = "'\"<>"
+SPARQL_INPUT_ESCAPE_TRANSLATION_TABLE = create_escape_translation_table(
+    SPARQL_INPUT_ESCAPE_CHARACTERS
+)
+SPARQL_INPUT_ESCAPE_PATTERN = re.compile(
+    f"[{re.escape(SPARQL_INPUT_ESCAPE_CHARACTERS)}]"
+)
 
 
 def convert_text_to_abstracted_string(
@@ -22,34 +37,42 @@ def convert_text_to_abstracted_string(
     The hash in the <> is the ID of the respective Annotation/LiteralString
     for reference.
     """
-    annotated_query_string = text
-
-    tokens = annotations + literals
-
-    for token in sorted(tokens, key=lambda t: t.begin, reverse=True):
-        if isinstance(token, Annotation):
-            text = (
-                token.named_entity_type.value.lower()
-                if token.named_entity_type is not None
-                else token.text
-            )
-            substitution_text = f"{{{text}" f"<{token.id}>}}"
-        elif isinstance(token, LiteralString):
-            substitution_text = f"{token.text}<{token.id}>"
-        else:
-            raise TypeError(
-                f"The given token has type {type(token)}, "
-                f"while a Token is demanded!"
-            )
-
-        annotated_query_string = replace_substring_between_positions(
-            original_text=annotated_query_string,
-            substituting_text=substitution_text,
-            begin=token.begin,
-            end=token.end,
+    tokens = sorted([*annotations, *literals], key=get_begin)
+
+    # Collecting the parts and joining them once avoids copying the whole string
+    # for every token.
+    string_parts = []
+    cursor = 0
+    for token in tokens:
+        string_parts.append(text[cursor : token.begin])
+        string_parts.append(create_substitution_text(token))
+        cursor = token.end
+
+    string_parts.append(text[cursor:])
+
+    return "".join(string_parts)
+
+
+def create_substitution_text(token: Union[Annotation, LiteralString]) -> str:
+    """Returns the text that represents the given token in the abstracted string.
+
+    Raises:
+        TypeError: If the token is neither an Annotation nor a LiteralString.
+    """
+    if isinstance(token, Annotation):
+        text = (
+            token.named_entity_type.value.lower()
+            if token.named_entity_type is not None
+            else token.text
         )
+        return f"{{{text}<{token.id}>}}"
 
-    return annotated_query_string
+    if isinstance(token, LiteralString):
+        return f"{token.text}<{token.id}>"
+
+    raise TypeError(
+        f"The given token has type {type(token)}, while a Token is demanded!"
+    )
 
 
 def replace_substring_between_positions(
@@ -62,13 +85,7 @@ def replace_substring_between_positions(
     :param end: The last character position in the original_text.
     :return: The manipulated string.
     """
-    return "".join(
-        (
-            original_text[:begin],
-            substituting_text,
-            original_text[end:],
-        )
-    )
+    return f"{original_text[:begin]}{substituting_text}{original_text[end:]}"
 
 
 def prepare_value_for_sparql(value: Union[str, Uri, LiteralString]) -> str:
@@ -99,14 +116,13 @@ def prepare_value_for_sparql(value: Union[str, Uri, LiteralString]) -> str:
             original_text = value.text
 
         text = f'"{original_text}"'
-        if original_text.isnumeric():
+        if INTEGER_PATTERN.fullmatch(original_text) is not None:
             text = f"{text}^^<http://www.w3.org/2001/XMLSchema#integer>"
 
         return text
 
-    if not value.startswith("http"):
-        return value
-    if not value.startswith("<"):
+    # A string starting with "http" can not already be wrapped in brackets
+    if value.startswith("http"):
         return f"<{value}>"
     return value
 
@@ -122,5 +138,7 @@ def escape_sparql_input_string(text: str) -> str:
         * Less than sign ("<")
     """
 
-    characters = ("'", '"', "<", ">")
-    return escape_characters(text, characters)
+    if SPARQL_INPUT_ESCAPE_PATTERN.search(text) is None:
+        return text
+
+    return text.translate(SPARQL_INPUT_ESCAPE_TRANSLATION_TABLE)
@@ -26,7 +26,7 @@ ANNOTATION_PRIORITY = [
     MISC_ANNOTATION_STRING,
 ]
 
-IGNORE_AS_NAMED_ENTITY = {"oder", "and"}
+IGNORE_AS_NAMED_ENTITY = frozenset({"oder", "and"})
 
 SUBJECT_STRING = "subject"
 PREDICATE_STRING = "predicate"
@@ -42,26 +42,31 @@ PREDICATE_VALUE_CONTEXT_KEYWORD = "predicate_value"
 # Databases
 ENABLE_FALLBACK_DATABASE = True
 FALLBACK_DATABASE_CLASS = "enhanced_search.databases.key_value.SimpleKeyValueDatabase"
+# The values are stored already parsed. Databases like Redis hold the same data as
+# JSON strings.
 FALLBACK_DATABASE_DATA = {
-    "pflanze": '{"Plant_Flora": [["https://www.biofid.de/ontology/pflanzen", 3]]}',
-    "quercus": '{"Plant_Flora": [["https://www.biofid.de/ontology/quercus", 3]]}',
-    "quercus sylvestris": '{"Plant_Flora": '
-    '[["https://www.biofid.de/ontology/quercus_sylvestris", 3]]}',
-    "fagus": '{"Plant_Flora": [["https://www.biofid.de/ontology/fagus", 3]]}',
-    "fagus sylvatica": '{"Plant_Flora": '
-    '[["https://www.biofid.de/ontology/fagus_sylvatica", 3]]}',
-    "fagus sylvatica f. pendula (lodd.) dippel": '{"Plant_Flora": [['
-    '"https://www.biofid.de/ontology/fagus_sylvatica_pendula", 3]]}',
-    "deutschland": '{"Location_Place": [['
-    '"https://sws.geonames.org/deutschland", 3]]}',
-    "paris": '{"Location_Place": [["https://sws.geonames.org/paris", 3]],'
-    '"Plant_Flora": [["https://www.biofid.de/ontology/paris"'
-    ", 3]]}",
-    "rot": '{"Miscellaneous": [["https://pato.org/red_color", 3]]}',
-    "blüte": '{"Miscellaneous": [["https://pato.org/flower_part", 2]]}',
-    "gelb blüte": '{"Miscellaneous": [["https://flopo.org/yellow_flower", 3]]}',
-    "oder": '{"Location_Place": [["https://sws.geonames.org/oder_river", 3]]}',
-    "vogel": '{"Animal_Fauna": [["https://www.biofid.de/ontology/voegel", 3]]}',
+    "pflanze": {"Plant_Flora": [["https://www.biofid.de/ontology/pflanzen", 3]]},
+    "quercus": {"Plant_Flora": [["https://www.biofid.de/ontology/quercus", 3]]},
+    "quercus sylvestris": {
+        "Plant_Flora": [["https://www.biofid.de/ontology/quercus_sylvestris", 3]]
+    },
+    "fagus": {"Plant_Flora": [["https://www.biofid.de/ontology/fagus", 3]]},
+    "fagus sylvatica": {
+        "Plant_Flora": [["https://www.biofid.de/ontology/fagus_sylvatica", 3]]
+    },
+    "fagus sylvatica f. pendula (lodd.) dippel": {
+        "Plant_Flora": [["https://www.biofid.de/ontology/fagus_sylvatica_pendula", 3]]
+    },
+    "deutschland": {"Location_Place": [["https://sws.geonames.org/deutschland", 3]]},
+    "paris": {
+        "Location_Place": [["https://sws.geonames.org/paris", 3]],
+        "Plant_Flora": [["https://www.biofid.de/ontology/paris", 3]],
+    },
+    "rot": {"Miscellaneous": [["https://pato.org/red_color", 3]]},
+    "blüte": {"Miscellaneous": [["https://pato.org/flower_part", 2]]},
+    "gelb blüte": {"Miscellaneous": [["https://flopo.org/yellow_flower", 3]]},
+    "oder": {"Location_Place": [["https://sws.geonames.org/oder_river", 3]]},
+    "vogel": {"Animal_Fauna": [["https://www.biofid.de/ontology/voegel", 3]]},
 }
 
 # See module factories.DatabaseFactory for an example of how databases are configured.
@@ -1,7 +1,30 @@
 """Interfaces to talk to databases."""
 
-from .documents import SolrDatabase
-from .graph import SparqlGraphDatabase
-from .key_value import RedisDatabase
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .documents import SolrDatabase
+    from .graph import SparqlGraphDatabase
+    from .key_value import RedisDatabase
+
+# The database classes are only imported on first access, since the client libraries
+# they depend on (e.g. pysolr, redis) take considerable time to import.
+_lazy_imports = {
+    "SolrDatabase": ".documents",
+    "SparqlGraphDatabase": ".graph",
+    "RedisDatabase": ".key_value",
+}
 
 __all__ = ["SparqlGraphDatabase", "RedisDatabase", "SolrDatabase"]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _lazy_imports.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+
+    return value
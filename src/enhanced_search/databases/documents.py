@@ -1,11 +1,12 @@
 """Database interfaces to talk to different Document Databases."""
 
 import json
+import re
 
 import pysolr
 
 from enhanced_search.errors import UserInputException
-from enhanced_search.utils import escape_characters
+from enhanced_search.utils import create_escape_translation_table
 
 EXCLUDE_IN_SOLR_QUERY = [
     "qt=",
@@ -16,7 +17,19 @@ EXCLUDE_IN_SOLR_QUERY = [
     "/update",
     "shards=",
 ]
+EXCLUDE_IN_SOLR_QUERY_PATTERN = re.compile(
+    "|".join(re.escape(evil.lower()) for evil in EXCLUDE_IN_SOLR_QUERY)
+)
 SOLR_SPECIAL_CHARACTERS = "&|+\\!(){}[\\]*^~?:$="
+SOLR_ESCAPE_CHARACTERS = "&|+\\!(){}[\\]*^~?:$=-"
+SOLR_ESCAPE_TRANSLATION_TABLE = create_escape_translation_table(SOLR_ESCAPE_CHARACTERS)
+SOLR_ESCAPE_TRANSLATION_TABLE_WITH_QUOTATIONS = create_escape_translation_table(
+    f"{SOLR_ESCAPE_CHARACTERS}\"'"
+)
+SOLR_ESCAPE_PATTERN = re.compile(f"[{re.escape(SOLR_ESCAPE_CHARACTERS)}]")
+SOLR_ESCAPE_PATTERN_WITH_QUOTATIONS = re.compile(
+    f"[{re.escape(SOLR_ESCAPE_CHARACTERS)}\"']"
+)
 
 
 class SolrDatabase:
@@ -70,11 +83,18 @@ def escape_solr_input(query: str, ignore_quotations: bool = False) -> str:
         ignore_quotations: If True, single and double quotation marks are not
                             escaped.
     """
-    solr_escape_characters = list("&|+\\!(){}[\\]*^~?:$=-")
-    if not ignore_quotations:
-        solr_escape_characters.extend(['"', "'"])
+    if ignore_quotations:
+        pattern = SOLR_ESCAPE_PATTERN
+        translation_table = SOLR_ESCAPE_TRANSLATION_TABLE
+    else:
+        pattern = SOLR_ESCAPE_PATTERN_WITH_QUOTATIONS
+        translation_table = SOLR_ESCAPE_TRANSLATION_TABLE_WITH_QUOTATIONS
 
-    return escape_characters(text=query, escape_characters=solr_escape_characters)
+    # Most queries contain no special characters at all
+    if pattern.search(query) is None:
+        return query
+
+    return query.translate(translation_table)
 
 
 def is_solr_query_safe(query) -> bool:
@@ -84,7 +104,7 @@ def is_solr_query_safe(query) -> bool:
     """
 
     lowered_query = query.lower()
-    if any(evil.lower() in lowered_query for evil in EXCLUDE_IN_SOLR_QUERY):
+    if EXCLUDE_IN_SOLR_QUERY_PATTERN.search(lowered_query) is not None:
         return False
 
     # Everything was fine
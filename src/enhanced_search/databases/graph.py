@@ -1,10 +1,20 @@
 """Database interfaces to talk to different Graph and Triple-Store Databases."""
 
-import json
+import re
+import threading
 from typing import Optional, Protocol
 
 from SPARQLWrapper import SPARQLWrapper
 
+from enhanced_search import configuration as config
+from enhanced_search.utils import create_escape_translation_table
+
+SPARQL_ESCAPE_CHARACTERS = "\\'\"#<>"
+SPARQL_ESCAPE_TRANSLATION_TABLE = create_escape_translation_table(
+    SPARQL_ESCAPE_CHARACTERS
+)
+SPARQL_ESCAPE_PATTERN = re.compile(f"[{re.escape(SPARQL_ESCAPE_CHARACTERS)}]")
+
 
 class KnowledgeDatabase(Protocol):
     """An interface class to interact with any graph database.
@@ -37,28 +47,58 @@ class SparqlGraphDatabase:
     The current implementation makes POST requests per default, to avoid getting
     errors due to too large SPARQL query strings.
 
+    A SPARQLWrapper object is not thread-safe. Hence, each thread uses its own
+    SPARQLWrapper object.
+
+    Only the "json" return format is supported, since the SemanticEngines parse the
+    responses as SPARQL JSON results.
+
     Obeys the KnowledgeDatabase interface.
     """
 
+    SUPPORTED_RETURN_FORMATS = ("json",)
+
     def __init__(
         self, url: str, return_format: str = "json", request_type: str = "POST"
     ):
+        if return_format not in self.SUPPORTED_RETURN_FORMATS:
+            raise ValueError(
+                f"The return format '{return_format}' is not supported! "
+                f"Supported formats are: {', '.join(self.SUPPORTED_RETURN_FORMATS)}"
+            )
+
         self.url = url
         self.return_format = return_format
         self.request_type = request_type
 
-        self._db = self._create_sparql_connector()
+        self._thread_local_data = threading.local()
 
     def read(self, query: str, is_safe: bool = False) -> str:
         """Queries a database with the given query string and
         parameters and returns the retrieved data as string.
+
+        The response body of the endpoint (a SPARQL JSON results document) is
+        returned unchanged. Hence, its formatting (e.g. whitespace) is up to the
+        endpoint and the string should always be parsed, not compared.
         """
         if not is_safe:
             query = escape_sparql_input(query)
 
-        self._db.setQuery(query)
+        sparql = self._get_sparql_connector()
+        sparql.setQuery(query)
+
+        # The response body already is the requested string. Converting it to
+        # Python objects and serializing it again is not necessary.
+        query_result = sparql.query()
+        return query_result.response.read().decode(config.UTF8_STRING)
 
-        return json.dumps(self._db.queryAndConvert())
+    def _get_sparql_connector(self) -> SPARQLWrapper:
+        sparql = getattr(self._thread_local_data, "sparql", None)
+        if sparql is None:
+            sparql = self._create_sparql_connector()
+            self._thread_local_data.sparql = sparql
+
+        return sparql
 
     def _create_sparql_connector(self) -> SPARQLWrapper:
         sparql = SPARQLWrapper(endpoint=self.url, returnFormat=self.return_format)
@@ -74,16 +114,7 @@ def escape_sparql_input(text: str) -> str:
         * Backslashes
         * Hashtags
     """
-    characters_to_escape = [
-        "\\",
-        "'",
-        '"',
-        "#",
-        "<",
-        ">",
-    ]  # backslash has to be the first escaped character!
-
-    for char in characters_to_escape:
-        text = text.replace(char, f"\\{char}")
-
-    return text
+    if SPARQL_ESCAPE_PATTERN.search(text) is None:
+        return text
+
+    return text.translate(SPARQL_ESCAPE_TRANSLATION_TABLE)
@@ -1,13 +1,12 @@
 """Database interfaces to talk to different Key-Value Databases."""
 
-import json
 import pathlib
-from functools import singledispatchmethod
-from typing import Optional, Protocol
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Protocol, Set, Union
 
 from redis import Redis  # type: ignore
 
-from enhanced_search import configuration as config
+from enhanced_search.utils import load_json
 
 
 class KeyValueDatabase(Protocol):
@@ -16,9 +15,10 @@ class KeyValueDatabase(Protocol):
     Obeys the Database interface.
     """
 
-    def read(self, query: str, *args, **kwargs) -> str:
+    def read(self, query: str, *args, **kwargs) -> Optional[Union[str, dict]]:
         """Queries a database with the given query string and
-        parameters and returns the retrieved data as string.
+        parameters and returns the retrieved data as string. Databases that
+        hold their data in memory may also return the already parsed data.
         """
 
     def sanitize_query(self, text: str) -> str:
@@ -33,11 +33,14 @@ class RedisDatabase:
     Redis is nearly immune against many common attack vectors, but
     some caution should be taken!
     (see https://stackoverflow.com/a/26528595/7504509; CC-BY-SA 3.0).
+    The characters stripped from the queries are taken from `malicious_characters`
+    when the object is created.
 
     Obeys the KeyValueDatabase interface.
     """
 
     MALICIOUS_CHARACTERS = {":"}
+    SANITIZATION_CACHE_SIZE = 4096
 
     def __init__(
         self,
@@ -52,6 +55,7 @@ class RedisDatabase:
         self.db_number = db_number
         self.credentials = {}
         self.malicious_characters = self.MALICIOUS_CHARACTERS
+        self._malicious_characters_string = "".join(sorted(self.malicious_characters))
 
         if user is not None:
             self.credentials = {"username": user, "password": password}
@@ -69,11 +73,30 @@ class RedisDatabase:
 
         return self._db.get(query)
 
+    def read_many(
+        self, queries: Iterable[str], is_safe: bool = False
+    ) -> List[Optional[str]]:
+        """Get the associated values for all given queries ("keys") with a single
+        round-trip to Redis. The order of the values corresponds to the queries.
+        :param queries: The key values to look up.
+        :param is_safe: If True, no sanitizing will be done. Otherwise,
+                potential malicious characters are stripped (Default).
+        """
+        if not is_safe:
+            queries = [self.sanitize_query(query) for query in queries]
+        else:
+            queries = list(queries)
+
+        if not queries:
+            return []
+
+        return self._db.mget(queries)
+
     def sanitize_query(self, text: str) -> str:
-        """Strips potentially malicious string from the text."""
-        for char in self.malicious_characters:
-            text = text.replace(char, "")
-        return text
+        """Strips potentially malicious string from the text.
+        The results are cached.
+        """
+        return _strip_characters(text, self._malicious_characters_string)
 
     def _create_redis_connection(self) -> Redis:
         parameters = {
@@ -88,45 +111,97 @@ class RedisDatabase:
         return Redis(**parameters)
 
 
+# The same keys are looked up over and over again during annotation
+@lru_cache(maxsize=RedisDatabase.SANITIZATION_CACHE_SIZE)
+def _strip_characters(text: str, characters: str) -> str:
+    return text.translate(_create_deletion_table(characters))
+
+
+@lru_cache(maxsize=None)
+def _create_deletion_table(characters: str) -> Dict[int, Optional[int]]:
+    """Returns a translation table for `str.translate` that deletes the given
+    characters. Only a few character sets are used, so the tables are cached.
+    """
+    return str.maketrans("", "", characters)
+
+
 class SimpleKeyValueDatabase:
     """A simple wrapper around a dictionary.
+    The given data is copied, hence, later changes to it do not affect the database.
+    Use `parse_data` to add data.
 
     Should NOT be used in production!
     """
 
     def __init__(self, data: Optional[dict] = None):
-        self._db = data if data is not None else {}
+        self._db = dict(data) if data is not None else {}
+        self._key_prefixes: Optional[Set[str]] = None
 
-    def read(self, query: str, is_safe: bool = False) -> Optional[str]:
+    def read(self, query: str, is_safe: bool = False) -> Optional[Union[str, dict]]:
         """Get the associated value for the given query ("key").
         :param query: The key value to look up.
-        :param is_safe: If True, no sanitizing will be done. Otherwise,
-                potential malicious characters are stripped (Default).
+        :param is_safe: Is ignored, since this database does no sanitizing.
         """
-        if not is_safe:
-            query = self.sanitize_query(query)
-
+        _ = is_safe
         return self._db.get(query)
 
+    def read_many(
+        self, queries: Iterable[str], is_safe: bool = False
+    ) -> List[Optional[Union[str, dict]]]:
+        """Get the associated values for all given queries ("keys").
+        :param queries: The key values to look up.
+        :param is_safe: Is ignored, since this database does no sanitizing.
+        """
+        _ = is_safe
+        return [self._db.get(query) for query in queries]
+
     def sanitize_query(self, text: str) -> str:
         """In this Database, it does nothing."""
         return text
 
-    @singledispatchmethod
-    def parse_data(self, data) -> None:
-        """Reads data to the database."""
-        raise TypeError(f"The data type of {type(data)} is not supported!")
+    def has_keys_with_prefix(self, prefix: str) -> bool:
+        """Checks if any key in the database starts with the given words.
+        Only whole words are considered, i.e. "fagus" is a prefix of
+        "fagus sylvatica", but "fag" is not.
+
+        The prefix index is built on the first call, so that loading data into the
+        database stays cheap.
+        """
+        if self._key_prefixes is None:
+            self._key_prefixes = create_key_prefix_index(self._db)
 
-    @parse_data.register
-    def _(self, data: dict) -> None:
-        """Reads the data directly into the database."""
-        self._db.update(data)
+        return prefix in self._key_prefixes
 
-    @parse_data.register
-    def _(self, json_data_path: pathlib.Path) -> None:
+    def parse_data(self, data: Union[dict, pathlib.Path]) -> None:
+        """Reads data to the database.
+        The data can either be a dictionary or the path to a JSON file.
+        """
+        if isinstance(data, dict):
+            self._db.update(data)
+            self._key_prefixes = None
+        elif isinstance(data, pathlib.Path):
+            self._parse_json_file(data)
+        else:
+            raise TypeError(f"The data type of {type(data)} is not supported!")
+
+    def _parse_json_file(self, json_data_path: pathlib.Path) -> None:
         """Reads the data from a given json-file into the database."""
-        with open(json_data_path, "r", encoding=config.UTF8_STRING) as f:
-            data_string = f.read()
-            data = json.loads(data_string)
+        # Reading bytes lets orjson (if installed) skip the decoding to a string
+        with open(json_data_path, "rb") as f:
+            data = load_json(f.read())
 
         self.parse_data(data)
+
+
+def create_key_prefix_index(data: dict) -> Set[str]:
+    """Returns all word-wise prefixes of the keys in the given data.
+    E.g. the key "fagus sylvatica" results in {"fagus", "fagus sylvatica"}.
+    """
+    key_prefixes: Set[str] = set()
+    for key in data.keys():
+        words = key.split(" ")
+        key_prefixes.update(
+            " ".join(words[:index]) for index in range(1, len(words) + 1)
+        )
+
+    return key_prefixes
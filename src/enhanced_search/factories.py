@@ -1,8 +1,8 @@
 """Here, factory classes are defined that allow the easy creation of complex objects."""
 
 import importlib
-from copy import deepcopy
-from typing import Any, List, Type
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from enhanced_search import configuration as config
 from enhanced_search.annotation.query.engines import SemanticEngine
@@ -21,6 +21,15 @@ from enhanced_search.databases.interface import Database
 
 CLASS_PATH_KEYWORD = "class"
 
+# Database objects are shared by all DatabaseFactory objects. Each database is stored
+# by its name together with the configuration it was created with.
+_database_instances: Dict[str, Tuple[dict, Database]] = {}
+
+# The default AnnotationEngines hold no state between annotations and are shared by all
+# default TextAnnotators using a configured key-value Database. They are stored
+# together with the Database they were created with.
+_default_annotation_engines: Dict[str, Tuple[Database, List[AnnotationEngine]]] = {}
+
 
 class TextAnnotatorFactory:
     """A simple factory that takes care of all the configuration of a TextAnnotator."""
@@ -37,14 +46,34 @@ class TextAnnotatorFactory:
         """Creates a TextAnnotator object by the given configuration."""
         return TextAnnotator(engines)
 
-    def _get_default_configuration(self):
+    def _get_default_configuration(self) -> List[AnnotationEngine]:
+        """Returns the default AnnotationEngines. With a configured key-value Database,
+        the engines are shared and only created anew, if the Database changed.
+        Otherwise, the engines are created with a new fallback database.
+        """
         database_factory = DatabaseFactory()
 
         try:
             key_value_db = database_factory.create(self.DEFAULT_KEY_VALUE_DATABASE_NAME)
         except KeyError:
-            key_value_db = self._create_fallback_database()
+            return self._create_default_engines(self._create_fallback_database())
 
+        cached_engines = _default_annotation_engines.get(
+            self.DEFAULT_KEY_VALUE_DATABASE_NAME
+        )
+        if cached_engines is not None and cached_engines[0] is key_value_db:
+            return list(cached_engines[1])
+
+        engines = self._create_default_engines(key_value_db)
+        _default_annotation_engines[self.DEFAULT_KEY_VALUE_DATABASE_NAME] = (
+            key_value_db,
+            engines,
+        )
+
+        return list(engines)
+
+    @staticmethod
+    def _create_default_engines(key_value_db: Database) -> List[AnnotationEngine]:
         return [
             SimpleTokenizer(),
             SimpleLemmatizer(),
@@ -91,9 +120,7 @@ class SemanticEngineFactory:
         :raises KeyError: When the given engine_name is not defined.
         """
         registered_engines = self._retrieve_engine_configurations()
-        engine_parameters: dict = deepcopy(registered_engines[engine_name])
-
-        self._load_database(engine_parameters)
+        engine_parameters = self._load_database(registered_engines[engine_name])
 
         engine_import_path = engine_parameters.pop(CLASS_PATH_KEYWORD)
         semantic_engine_callable = load_class(module_path=engine_import_path)
@@ -103,7 +130,12 @@ class SemanticEngineFactory:
     def _retrieve_engine_configurations(self) -> dict:
         return config.SEMANTIC_ENGINES
 
-    def _load_database(self, engine_parameters: dict) -> None:
+    def _load_database(self, engine_configuration: dict) -> dict:
+        """Returns a copy of the given engine configuration, in which the database name
+        is replaced by the respective Database object. The configuration itself is
+        not modified.
+        """
+        engine_parameters = dict(engine_configuration)
         database_name = engine_parameters.pop(
             self.DATABASE_NAME_CONFIGURATION_KEYWORD, None
         )
@@ -112,6 +144,8 @@ class SemanticEngineFactory:
             database = database_factory.create(database_name)
             engine_parameters[self.DATABASE_NAME_CONFIGURATION_KEYWORD] = database
 
+        return engine_parameters
+
 
 class DatabaseFactory:
     """Orchestrates the creation of configured Database objects.
@@ -140,6 +174,10 @@ class DatabaseFactory:
     provides the import path for the required Database class.
     Everything else in the value dictionary will be used as input parameters for
     the Database constructor.
+
+    A created Database object is reused by all following calls with the same name,
+    as long as its configuration does not change. Use `invalidate` to enforce the
+    creation of a new object.
     """
 
     def create(self, database_name: str) -> Database:
@@ -149,9 +187,30 @@ class DatabaseFactory:
         :raises TypeError: If the provided class does not obey the Database interface.
         """
         database_configurations = self._retrieve_database_configurations()
-        requested_database_parameters: dict = deepcopy(
-            database_configurations[database_name]
-        )
+        database_configuration = database_configurations[database_name]
+
+        cached_database = _database_instances.get(database_name)
+        if cached_database is not None and cached_database[0] == database_configuration:
+            return cached_database[1]
+
+        database = self._create_database(database_configuration)
+        _database_instances[database_name] = (dict(database_configuration), database)
+
+        return database
+
+    @staticmethod
+    def invalidate(database_name: Optional[str] = None) -> None:
+        """Removes the stored Database object with the given name, so that it is
+        created anew on the next call of `create`. If no name is given, all stored
+        Database objects are removed.
+        """
+        if database_name is None:
+            _database_instances.clear()
+        else:
+            _database_instances.pop(database_name, None)
+
+    def _create_database(self, database_configuration: dict) -> Database:
+        requested_database_parameters = dict(database_configuration)
 
         if CLASS_PATH_KEYWORD not in requested_database_parameters:
             raise KeyError(
@@ -175,8 +234,10 @@ class DatabaseFactory:
         return load_class(module_path)
 
 
+@lru_cache(maxsize=None)
 def load_class(module_path: str) -> Type[Any]:
     """Load a type class from the given module path.
+    The loaded classes are cached per module path.
 
     :raises TypeError: If the required_type is not None and if the loaded class is not
     a subclass of the required_type.
@@ -2,10 +2,23 @@
 
 from __future__ import annotations as ann
 
+import operator
+from collections import Counter
 from collections.abc import Collection
 from copy import copy
 from dataclasses import dataclass
-from typing import Any, List, Optional, Set, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from solrq import Q as SolrQueryBuilder
 from solrq import Value
@@ -23,6 +36,12 @@ from enhanced_search.databases.documents import escape_solr_input
 OR_STRING = "OR"
 AND_STRING = "AND"
 
+SOLR_QUERY_CACHE_SIZE = 256
+
+SearchTermsCache = Dict[FrozenSet[Union[Uri, LiteralString]], Tuple[str, ...]]
+# The sorted subject and object search terms and the relationship of a Statement
+StatementSearchTerms = Tuple[Tuple[str, ...], Tuple[str, ...], RelationshipType]
+
 
 @dataclass
 class SolrQuery:
@@ -60,134 +79,184 @@ class SolrQueryGenerator:
             * URIs are always wrapped in quotation marks.
             * Strings are quoted with double quotation marks.
         """
-        query_builder = None
-
-        annotations = copy(query.annotations)
-        literals = copy(query.literals)
+        annotations = query.annotations
+        literals = query.literals
+        search_terms_cache: SearchTermsCache = {}
+        statement_search_terms: Tuple[StatementSearchTerms, ...] = ()
+
+        if query.statements:
+            # Processing the statements removes elements, but the Query stays as is
+            annotations = copy(annotations)
+            literals = copy(literals)
+
+            statement_search_terms = self._collect_statement_search_terms(
+                statements=query.statements,
+                annotations=annotations,
+                literals=literals,
+                search_terms_cache=search_terms_cache,
+            )
 
-        query_builder = self._update_query_builder_from_statements(
-            query_builder=query_builder,
-            statements=query.statements,
-            solr_search_field=self.default_search_field,
-            annotations=annotations,
-            literals=literals,
+        annotation_search_terms = tuple(
+            _get_sorted_search_terms(annotation.uris, search_terms_cache)
+            for annotation in annotations
         )
+        literal_search_terms = tuple(_setup_entity(literal) for literal in literals)
 
-        for annotation in annotations:
-            query_builder = self._add_term_collections_to_solr_query(
-                # Sorting of URIs is mainly for testing purposes
-                search_terms=sorted(_setup_entity(uri) for uri in annotation.uris),
-                search_field_name=self.default_search_field,
-                conjunction_string=OR_STRING,
-                query_builder=query_builder,
-            )
-
-        if literals:
-            query_builder = self._add_term_collections_to_solr_query(
-                search_terms=[_setup_entity(literal) for literal in literals],
-                search_field_name=self.default_search_field,
-                conjunction_string=AND_STRING,
-                query_builder=query_builder,
-            )
+        query_string = _compile_solr_query_string(
+            statement_search_terms,
+            annotation_search_terms,
+            literal_search_terms,
+            self.default_search_field,
+            self.default_conjunction_type,
+        )
 
-        return _compile_solr_query(query_builder)
+        return SolrQuery(query_string)
 
-    def _update_query_builder_from_statements(
+    def _collect_statement_search_terms(
         self,
-        query_builder: Optional[SolrQueryBuilder],
         statements: List[Statement],
-        solr_search_field: str,
         annotations: List[Annotation],
         literals: List[LiteralString],
-    ) -> SolrQueryBuilder:
-        """Processes the statements and adds their semantics to a SolrQueryBuilder.
+        search_terms_cache: Optional[SearchTermsCache] = None,
+    ) -> Tuple[StatementSearchTerms, ...]:
+        """Returns the search terms of the subject and object of all statements with a
+        relationship, together with this relationship.
 
         This process also updates the `annotations` and `literals`. I.e. it removes
         all elements that where processed.
         """
-        statement_query_builders = []
+        if search_terms_cache is None:
+            search_terms_cache = {}
+
+        statement_search_terms = []
+        annotation_index = _create_uri_annotation_index(annotations)
+        processed_elements: Counter = Counter()
 
         for statement in statements:
             if statement.relationship is not None:
                 subj = _to_collection(statement.subject)
-                element_a_builder = self._add_term_collections_to_solr_query(
-                    search_terms=sorted(_setup_entity(entity) for entity in subj),
-                    search_field_name=solr_search_field,
-                    conjunction_string=OR_STRING,
-                )
-
                 obj = _to_collection(statement.object)
-                element_b_builder = self._add_term_collections_to_solr_query(
-                    search_terms=sorted(_setup_entity(entity) for entity in obj),
-                    search_field_name=solr_search_field,
-                    conjunction_string=OR_STRING,
-                )
-
-                statement_query_builder = _merge_builders(
-                    element_a_builder, element_b_builder, statement.relationship
+                statement_search_terms.append(
+                    (
+                        _get_sorted_search_terms(subj, search_terms_cache),
+                        _get_sorted_search_terms(obj, search_terms_cache),
+                        statement.relationship,
+                    )
                 )
 
-                statement_query_builders.append(statement_query_builder)
-
                 for element in [statement.subject, statement.object]:
                     if element is None:
                         continue
 
                     if isinstance(element, LiteralString):
-                        literals.remove(element)
+                        processed_elements[element] += 1
                     else:
-                        annotation = _get_annotation_for_uris(element, annotations)
+                        annotation = _get_annotation_for_uris(element, annotation_index)
                         if annotation is not None:
-                            annotations.remove(annotation)
+                            processed_elements[annotation] += 1
+                            _remove_annotation_from_index(annotation, annotation_index)
+
+        _remove_processed_elements(annotations, processed_elements)
+        _remove_processed_elements(literals, processed_elements)
+
+        return tuple(statement_search_terms)
+
+
+@lru_cache(maxsize=SOLR_QUERY_CACHE_SIZE)
+def _compile_solr_query_string(
+    statement_search_terms: Tuple[StatementSearchTerms, ...],
+    annotation_search_terms: Tuple[Tuple[str, ...], ...],
+    literal_search_terms: Tuple[str, ...],
+    search_field_name: str,
+    conjunction_type: RelationshipType,
+) -> str:
+    """Builds the Solr query string from the already escaped search terms.
+    The query strings are cached, since the same queries are often requested
+    repeatedly (e.g. for paging). All parameters are immutable, so a cached string
+    can not get stale.
+    """
+    query_builder = None
+
+    statement_query_builders = [
+        _merge_builders(
+            _add_term_collections_to_solr_query(
+                subject_terms, search_field_name, OR_STRING, conjunction_type
+            ),
+            _add_term_collections_to_solr_query(
+                object_terms, search_field_name, OR_STRING, conjunction_type
+            ),
+            relationship,
+        )
+        for subject_terms, object_terms, relationship in statement_search_terms
+    ]
+    for statement_query_builder in statement_query_builders:
+        query_builder = _merge_builders(
+            query_builder, statement_query_builder, conjunction_type
+        )
 
-        for statement_query_builder in statement_query_builders:
-            query_builder = _merge_builders(
-                query_builder, statement_query_builder, self.default_conjunction_type
-            )
+    for search_terms in annotation_search_terms:
+        query_builder = _add_term_collections_to_solr_query(
+            search_terms, search_field_name, OR_STRING, conjunction_type, query_builder
+        )
 
-        return query_builder
+    if literal_search_terms:
+        query_builder = _add_term_collections_to_solr_query(
+            literal_search_terms,
+            search_field_name,
+            AND_STRING,
+            conjunction_type,
+            query_builder,
+        )
 
-    def _add_term_collections_to_solr_query(
-        self,
-        search_terms: Collection[str],
-        search_field_name: str,
-        conjunction_string: str,
-        query_builder: Optional[SolrQueryBuilder] = None,
-    ) -> SolrQueryBuilder:
-        """Merges to given search terms to a new SolrQueryBuilder.
-
-        The search terms will be conjuncted with the given `conjunction string`.
-        If there is more than one search term, the search terms will be wrapped into
-        round brackets.
-
-        Args:
-            search_terms: The search terms to add to the Solr query.
-            search_field_name: The name of the Solr search field, the URIs should be
-                                searched in.
-            conjunction_string: The string that will be inserted between the single
-                                search terms (should be "OR" or "AND").
-            query_builder: (Optional) A SolrQueryBuilder object that is merged with
-                                the search terms.
-
-        Returns:
-            An new SolrQueryBuilder object.
-        """
+    return str(query_builder)
 
-        search_terms_string = f" {conjunction_string} ".join(search_terms)
 
-        if len(search_terms) > 1:
-            search_terms_string = _wrap_in_round_brackets(search_terms_string)
+def _add_term_collections_to_solr_query(
+    search_terms: Collection[str],
+    search_field_name: str,
+    conjunction_string: str,
+    conjunction_type: RelationshipType,
+    query_builder: Optional[SolrQueryBuilder] = None,
+) -> SolrQueryBuilder:
+    """Merges to given search terms to a new SolrQueryBuilder.
+
+    The search terms will be conjuncted with the given `conjunction string`.
+    If there is more than one search term, the search terms will be wrapped into
+    round brackets.
+
+    Args:
+        search_terms: The search terms to add to the Solr query.
+        search_field_name: The name of the Solr search field, the URIs should be
+                            searched in.
+        conjunction_string: The string that will be inserted between the single
+                            search terms (should be "OR" or "AND").
+        conjunction_type: The RelationshipType to merge the search terms with
+                            the `query_builder`.
+        query_builder: (Optional) A SolrQueryBuilder object that is merged with
+                            the search terms.
+
+    Returns:
+        An new SolrQueryBuilder object.
+    """
 
-        return _create_conjunction(
-            query_builder,
-            search_field_name,
-            search_terms_string,
-            self.default_conjunction_type,
-        )
+    number_of_search_terms = len(search_terms)
 
+    if number_of_search_terms == 1:
+        # The most common case needs neither joining nor brackets
+        (search_terms_string,) = search_terms
+    elif number_of_search_terms > 1:
+        search_terms_string = _wrap_in_round_brackets(
+            f" {conjunction_string} ".join(search_terms)
+        )
+    else:
+        search_terms_string = ""
 
-def _compile_solr_query(query_builder: SolrQueryBuilder) -> SolrQuery:
-    return SolrQuery(str(query_builder))
+    return _create_conjunction(
+        query_builder,
+        search_field_name,
+        search_terms_string,
+        conjunction_type,
+    )
 
 
 def _create_conjunction(
@@ -203,14 +272,15 @@ def _create_conjunction(
         NotImplementedError: If the given `relationship_type` is not implemented.
 
     """
-    if relationship_type == RelationshipType.AND:
-        return _create_and_conjunction(query_builder, solr_field_name, search_string)
-    if relationship_type == RelationshipType.OR:
-        return _create_or_conjunction(query_builder, solr_field_name, search_string)
+    merge = _get_builder_merge_operator(relationship_type)
 
-    raise NotImplementedError(
-        "The given RelationshipType is not implemented for this operation!"
+    new_query_builder = SolrQueryBuilder(
+        **{solr_field_name: Value(search_string, safe=True)}
     )
+    if query_builder is None:
+        return new_query_builder
+
+    return merge(query_builder, new_query_builder)
 
 
 def _merge_builders(
@@ -229,46 +299,28 @@ def _merge_builders(
     if builder is None:
         return other_builder
 
-    if relationship_type == RelationshipType.AND:
-        new_builder = builder & other_builder
-    elif relationship_type == RelationshipType.OR:
-        new_builder = builder | other_builder
-    else:
-        raise NotImplementedError(
-            "The given RelationshipType is not implemented for this operation!"
-        )
-
-    return new_builder
+    merge = _get_builder_merge_operator(relationship_type)
+    return merge(builder, other_builder)
 
 
-def _create_and_conjunction(
-    query_builder: Optional[SolrQueryBuilder], solr_field_name: str, search_string: str
-) -> SolrQueryBuilder:
-    """Creates a new SolrQueryBuilder object that holds an AND-conjunction of
-    the given parameters.
-    """
-    new_query_builder = SolrQueryBuilder(
-        **{solr_field_name: Value(search_string, safe=True)}
-    )
-    if query_builder is not None:
-        new_query_builder = query_builder & new_query_builder
+_builder_merge_operators: Dict[
+    RelationshipType, Callable[[SolrQueryBuilder, SolrQueryBuilder], SolrQueryBuilder]
+] = {
+    RelationshipType.AND: operator.and_,
+    RelationshipType.OR: operator.or_,
+}
 
-    return new_query_builder
 
+def _get_builder_merge_operator(
+    relationship_type: RelationshipType,
+) -> Callable[[SolrQueryBuilder, SolrQueryBuilder], SolrQueryBuilder]:
+    merge = _builder_merge_operators.get(relationship_type)
+    if merge is None:
+        raise NotImplementedError(
+            "The given RelationshipType is not implemented for this operation!"
+        )
 
-def _create_or_conjunction(
-    query_builder: Optional[SolrQueryBuilder], solr_field_name: str, search_string: str
-) -> SolrQueryBuilder:
-    """Creates a new SolrQueryBuilder object that holds an OR-conjunction of
-    the given parameters.
-    """
-    new_query_builder = SolrQueryBuilder(
-        **{solr_field_name: Value(search_string, safe=True)}
-    )
-    if query_builder is not None:
-        new_query_builder = query_builder | new_query_builder  # pylint: disable=E1131
-
-    return new_query_builder
+    return merge
 
 
 def _setup_entity(entity: Union[Uri, LiteralString]) -> str:
@@ -288,28 +340,81 @@ def _setup_entity(entity: Union[Uri, LiteralString]) -> str:
     return text
 
 
+def _get_sorted_search_terms(
+    entities: Collection[Union[Uri, LiteralString]],
+    search_terms_cache: SearchTermsCache,
+) -> Tuple[str, ...]:
+    """Returns the sorted search terms of the given entities. Sorting is mainly for
+    testing purposes. The search terms are cached per entity set, since the same
+    entities may occur in several statements of a query.
+    """
+    cache_key = frozenset(entities)
+    search_terms = search_terms_cache.get(cache_key)
+    if search_terms is None:
+        search_terms = tuple(sorted(_setup_entity(entity) for entity in entities))
+        search_terms_cache[cache_key] = search_terms
+
+    return search_terms
+
+
 def _wrap_in_round_brackets(text: str) -> str:
     """Adds round brackets "(" and ")" before the first and after the last character
     of the given text."""
     return f"({text})"
 
 
+def _create_uri_annotation_index(
+    annotations: List[Annotation],
+) -> Dict[Uri, List[Annotation]]:
+    """Maps each URI to all Annotations holding it, in the order of the given
+    Annotations.
+    """
+    annotation_index: Dict[Uri, List[Annotation]] = {}
+    for annotation in annotations:
+        for uri in annotation.uris:
+            annotation_index.setdefault(uri, []).append(annotation)
+
+    return annotation_index
+
+
+def _remove_annotation_from_index(
+    annotation: Annotation, annotation_index: Dict[Uri, List[Annotation]]
+) -> None:
+    for uri in annotation.uris:
+        annotation_index[uri].remove(annotation)
+
+
 def _get_annotation_for_uris(
-    uris: Set[Uri], annotations: List[Annotation]
+    uris: Set[Uri], annotation_index: Dict[Uri, List[Annotation]]
 ) -> Optional[Annotation]:
-    """Returns the corresponding Annotation to the given URIs."""
-    annotation_index = {
-        uri: annotation for annotation in annotations for uri in annotation.uris
-    }
-
+    """Returns the corresponding Annotation to the given URIs.
+    If several Annotations hold the same URI, the last one is returned.
+    """
     for uri in uris:
-        annotation = annotation_index.get(uri)
-        if annotation is not None:
-            return annotation
+        annotations = annotation_index.get(uri)
+        if annotations:
+            return annotations[-1]
 
     return None
 
 
+def _remove_processed_elements(elements: list, processed_elements: Counter) -> None:
+    """Removes the first occurrences of the processed elements from the given list
+    in place. The order of the remaining elements is kept.
+    """
+    if not processed_elements:
+        return
+
+    remaining_elements = []
+    for element in elements:
+        if processed_elements[element] > 0:
+            processed_elements[element] -= 1
+        else:
+            remaining_elements.append(element)
+
+    elements[:] = remaining_elements
+
+
 def _to_collection(obj: Any) -> Collection:
     if not isinstance(obj, str) and isinstance(obj, Collection):
         return obj
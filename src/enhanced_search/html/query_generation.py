@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from enhanced_search.annotation import Query
 
 from .sanitzation import get_from_data
@@ -6,7 +8,7 @@ from .sanitzation import get_from_data
 request_to_query_mapping = {"query": "original_string"}
 
 # Gives the parameters to sanitize a request parameter
-parameter_type_definitions = {
+parameter_type_definitions: Dict[str, Dict[str, Any]] = {
     "query": {
         "name": "query",
         "parameter_type": str,
@@ -14,6 +16,14 @@ parameter_type_definitions = {
     },
 }
 
+# Combines both mappings above, so that a request does not need to look them up.
+# Holds (query variable, parameter definitions) of all defined URL parameters.
+_query_parameter_definitions = tuple(
+    (query_variable, parameter_type_definitions[parameter_name])
+    for parameter_name, query_variable in request_to_query_mapping.items()
+    if parameter_name in parameter_type_definitions
+)
+
 
 def convert_request_data_to_query(request_data: dict) -> Query:
     """Takes a dictionary and returns a Query holding the data.
@@ -23,14 +33,9 @@ def convert_request_data_to_query(request_data: dict) -> Query:
          UserInputException: If a required parameter is not given or if a given
                              parameter value is not of the required type.
     """
-    sanitized_query_parameters = {}
-    for parameter_name, query_variable in request_to_query_mapping.items():
-        parameter_definitions = parameter_type_definitions.get(parameter_name)
-        if parameter_definitions is not None:
-            sanitized_value = get_from_data(
-                request_data, **parameter_definitions
-            )
-
-            sanitized_query_parameters[query_variable] = sanitized_value
+    sanitized_query_parameters = {
+        query_variable: get_from_data(request_data, **parameter_definitions)
+        for query_variable, parameter_definitions in _query_parameter_definitions
+    }
 
     return Query(**sanitized_query_parameters)
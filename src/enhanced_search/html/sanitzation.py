@@ -1,18 +1,38 @@
 """Functions interacting closely with HTML input and sanitize it."""
 
-from copy import copy
-from typing import Any, Callable, Optional, Union
+import re
+from typing import Any, Callable, Optional
 
 from enhanced_search.errors import UserInputException
-from enhanced_search.utils import escape_characters
+from enhanced_search.utils import create_escape_translation_table
 
-NON_ALPHANUMERIC_CHARACTERS = {
+# Marks a parameter that is missing in the data
+_MISSING = object()
+
+BOOLEAN_TRUE_STRINGS = frozenset({"true", "t", "1", "yes"})
+QUOTATION_CHARACTERS = frozenset({'"', "'"})
+NON_ALPHANUMERIC_CHARACTERS = frozenset(
     c for c in map(chr, range(256)) if not c.isalnum() and not c.isspace()
-}
+)
+NON_ALPHANUMERIC_CHARACTERS_WITHOUT_QUOTATIONS = (
+    NON_ALPHANUMERIC_CHARACTERS - QUOTATION_CHARACTERS
+)
+NON_ALPHANUMERIC_ESCAPE_TRANSLATION_TABLE = create_escape_translation_table(
+    NON_ALPHANUMERIC_CHARACTERS
+)
+NON_ALPHANUMERIC_ESCAPE_TRANSLATION_TABLE_WITHOUT_QUOTATIONS = (
+    create_escape_translation_table(NON_ALPHANUMERIC_CHARACTERS_WITHOUT_QUOTATIONS)
+)
+NON_ALPHANUMERIC_PATTERN = re.compile(
+    f"[{re.escape(''.join(sorted(NON_ALPHANUMERIC_CHARACTERS)))}]"
+)
+NON_ALPHANUMERIC_PATTERN_WITHOUT_QUOTATIONS = re.compile(
+    f"[{re.escape(''.join(sorted(NON_ALPHANUMERIC_CHARACTERS_WITHOUT_QUOTATIONS)))}]"
+)
 
 
 def get_from_data(
-    data: Union[dict],
+    data: Any,
     name: str,
     parameter_type: Optional[Callable] = None,
     optional: bool = False,
@@ -36,38 +56,28 @@ def get_from_data(
          UserInputException: If a required parameter is not given or if a given
                                 parameter value is not of the required type.
     """
-    is_name_in_data = name in data
-
-    if not optional and not is_name_in_data:
-        raise UserInputException(f"The parameter '{name}' is missing in the request!")
-
     # Handle Django QueryDict list parameters
     if parameter_type == list and hasattr(data, "getlist"):
-        parameter_value = data.getlist(name, default)
+        if name in data:
+            parameter_value = data.getlist(name)
+        elif optional:
+            # Django returns an empty list for a missing key, if the default is None
+            parameter_value = data.getlist(name, default)
+        else:
+            parameter_value = _MISSING
     else:
-        parameter_value = data.get(name, default)
-
-    if (
-        parameter_value is not None
-        and parameter_type is not None
-        and parameter_value != default  # Default value is not typed!
-    ):
-        try:
-            if isinstance(parameter_value, list) and parameter_type != list:
-                parameter_value = [parameter_type(value) for value in parameter_value]
-            elif parameter_type == bool:
-                parameter_value = str(parameter_value).lower() in {
-                    "true",
-                    "t",
-                    "1",
-                    "yes",
-                }
-            else:
-                parameter_value = parameter_type(parameter_value)
-        except ValueError:
-            raise_user_input_exception(
-                parameter_name_given_by_user=name, expected_type=parameter_type.__name__
-            )
+        parameter_value = data.get(name, _MISSING)
+
+    if parameter_value is _MISSING:
+        if optional:
+            return default
+        raise UserInputException(f"The parameter '{name}' is missing in the request!")
+
+    if parameter_value == default:  # Default value is neither typed nor escaped!
+        return parameter_value
+
+    if parameter_value is not None and parameter_type is not None:
+        parameter_value = _convert_to_type(name, parameter_value, parameter_type)
 
     if escape_function is not None and parameter_value != default:
         parameter_value = escape_function(parameter_value)
@@ -75,6 +85,23 @@ def get_from_data(
     return parameter_value
 
 
+def _to_bool(value: Any) -> bool:
+    return str(value).lower() in BOOLEAN_TRUE_STRINGS
+
+
+def _convert_to_type(name: str, parameter_value: Any, parameter_type: Callable) -> Any:
+    converter = _to_bool if parameter_type == bool else parameter_type
+    try:
+        if isinstance(parameter_value, list) and parameter_type != list:
+            return [converter(value) for value in parameter_value]
+        return converter(parameter_value)
+    except ValueError:
+        raise_user_input_exception(
+            parameter_name_given_by_user=name, expected_type=parameter_type.__name__
+        )
+        return None
+
+
 def sanitize_user_query_string(text: str, escape_quotations: bool = True) -> str:
     """Escapes potential malicious characters in the given text.
     The default behaviour is to escape all non-alphanumeric characters.
@@ -84,12 +111,18 @@ def sanitize_user_query_string(text: str, escape_quotations: bool = True) -> str
         escape_quotations (bool): If False, single and double quotations are left
                                   out when escaping. Default: True.
     """
-    characters = copy(NON_ALPHANUMERIC_CHARACTERS)
-    if not escape_quotations:
-        characters.remove('"')
-        characters.remove("'")
+    if escape_quotations:
+        pattern = NON_ALPHANUMERIC_PATTERN
+        translation_table = NON_ALPHANUMERIC_ESCAPE_TRANSLATION_TABLE
+    else:
+        pattern = NON_ALPHANUMERIC_PATTERN_WITHOUT_QUOTATIONS
+        translation_table = NON_ALPHANUMERIC_ESCAPE_TRANSLATION_TABLE_WITHOUT_QUOTATIONS
+
+    # Most user queries contain nothing to escape
+    if pattern.search(text) is None:
+        return text
 
-    return escape_characters(text, characters)
+    return text.translate(translation_table)
 
 
 def raise_user_input_exception(
@@ -1,6 +1,13 @@
 """Home to all functions that are useful throughout the whole package."""
 
-from typing import Iterable
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Pattern, Tuple, Union
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads  # type: ignore
 
 
 def escape_characters(text: str, escape_characters: Iterable) -> str:
@@ -9,7 +16,41 @@ def escape_characters(text: str, escape_characters: Iterable) -> str:
     Args:
         text: The text to escape.
         escape_characters: An iterable containing the characters that
-        have to be escaped.
+        have to be escaped. Items that are not a single character are ignored.
+    """
+    pattern, translation_table = _get_escape_pattern_and_translation_table(
+        frozenset(c for c in escape_characters if len(c) == 1)
+    )
+
+    if pattern.search(text) is None:
+        return text
+
+    return text.translate(translation_table)
+
+
+@lru_cache(maxsize=32)
+def _get_escape_pattern_and_translation_table(
+    escape_characters: FrozenSet[str],
+) -> Tuple[Pattern, Dict[int, str]]:
+    # An empty character class is invalid, hence a pattern that never matches
+    pattern = (
+        re.compile(f"[{re.escape(''.join(sorted(escape_characters)))}]")
+        if escape_characters
+        else re.compile(r"(?!)")
+    )
+    return pattern, create_escape_translation_table(escape_characters)
+
+
+def create_escape_translation_table(escape_characters: Iterable) -> Dict[int, str]:
+    """Creates a translation table for `str.translate` that prefixes each of the
+    given characters with a backslash.
+    """
+    return {ord(c): f"\\{c}" for c in escape_characters}
+
+
+def load_json(data: Union[str, bytes]) -> Any:
+    """Deserializes the given JSON data.
+    If the optional dependency `orjson` is installed, it is used for the parsing.
+    Otherwise, the `json` module of the standard library is used.
     """
-    escape_characters_set = set(escape_characters)
-    return "".join((f"\\{c}" if c in escape_characters_set else c for c in text))
+    return _json_loads(data)
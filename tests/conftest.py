@@ -74,18 +74,33 @@ def set_database_configuration(default_n_triples_source_path):
 
 
 # DATABASES #
-@pytest.fixture(scope="function")
-def empty_sparql_database() -> "DummySparqlKnowledgeDatabase":
-    """An empty SPARQL database."""
+@pytest.fixture(scope="module")
+def _shared_empty_sparql_database() -> "DummySparqlKnowledgeDatabase":
     return DummySparqlKnowledgeDatabase()
 
 
-@pytest.fixture(scope="function")
-def empty_key_value_database():
-    """An empty key-value database."""
+@pytest.fixture
+def empty_sparql_database(_shared_empty_sparql_database):
+    """An empty SPARQL database.
+    The database object is shared within a module, but emptied after each test."""
+    yield _shared_empty_sparql_database
+    _shared_empty_sparql_database.db.remove((None, None, None))
+
+
+@pytest.fixture(scope="module")
+def _shared_empty_key_value_database() -> "DummyKeyValueDatabase":
     return DummyKeyValueDatabase()
 
 
+@pytest.fixture
+def empty_key_value_database(_shared_empty_key_value_database):
+    """An empty key-value database.
+    The database object is shared within a module, but emptied after each test."""
+    yield _shared_empty_key_value_database
+    # The data may have been replaced by a shared dict, so it is not cleared in place
+    _shared_empty_key_value_database.data = {}
+
+
 @pytest.fixture(scope="session")
 def loaded_sparql_database(
     default_n_triples_source_path,
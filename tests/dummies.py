@@ -1,15 +1,21 @@
 """A set of dummy databases for testing purposes."""
 
 import pathlib
-from typing import Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union
 
-from rdflib import Graph
+# rdflib takes long to import and is only needed by the SPARQL dummy, so it is
+# imported on use to keep test collection fast.
+if TYPE_CHECKING:
+    from rdflib.plugins.sparql.sparql import Query
 
 
 class DummySparqlKnowledgeDatabase:
     """A dummy SPARQL database class that obeys the KnowledgeDatabase interface."""
 
     def __init__(self, rdf_source_path: Optional[Union[pathlib.Path, str]] = None):
+        from rdflib import Graph
+
         self.db = Graph()
 
         if rdf_source_path is not None:
@@ -20,7 +26,7 @@ class DummySparqlKnowledgeDatabase:
         parameters and returns the retrieved data as string.
         """
         _ = is_safe
-        result = self.db.query(query)
+        result = self.db.query(prepare_sparql_query(query))
 
         serialized_data = result.serialize(format="json")
 
@@ -38,6 +44,15 @@ class DummySparqlKnowledgeDatabase:
         return text
 
 
+@lru_cache(maxsize=256)
+def prepare_sparql_query(query: str) -> "Query":
+    """Parses the given SPARQL query. The tests send the same queries repeatedly,
+    so the parsed queries are cached."""
+    from rdflib.plugins.sparql import prepareQuery
+
+    return prepareQuery(query)
+
+
 class DummyKeyValueDatabase:
     """Returns a value for a given key.
     Since very short sequences or numerical values led in the past to mayor
@@ -59,7 +74,7 @@ class DummyKeyValueDatabase:
         return text
 
     def _raise_if_not_valid(self, query: str) -> None:
-        if query.isnumeric() or len(query) <= 2:
+        if len(query) <= 2 or query.isnumeric():
             raise KeyError(
                 f"Reading short or numerical-only values is forbidden "
                 f"for performance reasons! Provided was string: '{query}'"
@@ -587,6 +587,15 @@ class TestSemanticQueryProcessor:
         query_processor.resolve_query_annotations(query)
         assert query.statements == []
 
+    def test_no_semantic_engine_with_empty_query(self):
+        """Feature: A query without annotations and statements is not passed to
+        a SemanticEngine.
+        """
+        query_processor = SemanticQueryProcessor(semantic_engine_name="unknown")
+        query = Query("Foo")
+
+        assert query_processor.resolve_query_annotations(query) is False
+
     @pytest.mark.parametrize(
         ["query", "expected_result"],
         [
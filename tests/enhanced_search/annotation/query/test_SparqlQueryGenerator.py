@@ -1,4 +1,5 @@
 import json
+from copy import deepcopy
 from typing import List
 
 import pytest
@@ -126,6 +127,32 @@ class TestSparqlQueryGenerator:
         assert "https://www.biofid.de/ontology#pflanzen\\'" in sparql_query_string
         assert 'evil\\"' in sparql_query_string
 
+    def test_duplicated_statements_are_ignored(self, sparql_generator):
+        """Feature: Equal statements do not lead to repeated graph patterns."""
+        statement = Statement(
+            subject={Uri("https://www.biofid.de/ontology/pflanzen")},
+            predicate={Uri("https://pato.org/has_petal_count", 2)},
+            object=LiteralString(begin=15, end=16, text="3"),
+        )
+
+        assert sparql_generator.generate(
+            variable_name="?taxon", statements=[statement, deepcopy(statement)]
+        ) == sparql_generator.generate(variable_name="?taxon", statements=[statement])
+
+    def test_statements_are_not_modified(self, sparql_generator):
+        statements = [
+            Statement(
+                subject={Uri("https://www.biofid.de/ontology/pflanzen")},
+                predicate={Uri("https://pato.org/flower_part", 2)},
+                object={Uri("https://pato.org/red_color", 3)},
+            )
+        ]
+        expected_statements = deepcopy(statements)
+
+        sparql_generator.generate(variable_name="?taxon", statements=statements)
+
+        assert statements == expected_statements
+
     @pytest.fixture(scope="session")
     def sparql_generator(self):
         return SparqlQueryGenerator()
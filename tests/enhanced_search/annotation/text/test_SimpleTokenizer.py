@@ -1,6 +1,8 @@
 import pytest
 
 from enhanced_search.annotation import AnnotationResult
+from enhanced_search.annotation.text.engines.tokenizer import TOKEN_PATTERN
+from enhanced_search.annotation.text.utils import tokenize_text
 
 
 class TestSimpleTokenizer:
@@ -53,6 +55,27 @@ class TestSimpleTokenizer:
         assert [token.begin for token in annotation_result.tokens] == begins
         assert [token.end for token in annotation_result.tokens] == ends
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Das ist ein Test!",
+            "Ich suche 'Fagus sylvatica'    in  Hessen",
+            '"The quoted Journal" and \'another one\'',
+            "Fagus sylvatica f. pendula (Lodd.) Dippel",
+            "O'Brien's\tpaper\r\non 'Quercus robur'?",
+            "'a'b \"c\"d e'f'",
+            "  leading and trailing whitespace  ",
+            "",
+        ],
+    )
+    def test_token_pattern_equals_tokenize_text(self, text):
+        """Feature: The TOKEN_PATTERN splits a text like `tokenize_text` does
+        when keeping the quotations."""
+        tokens = [match.group() for match in TOKEN_PATTERN.finditer(text)]
+        assert [token for token in tokens if token] == [
+            token for token in tokenize_text(text, keep_quotations=True) if token
+        ]
+
     @pytest.fixture(scope="session")
     def tokenizer(self, simple_tokenizer):
         return simple_tokenizer
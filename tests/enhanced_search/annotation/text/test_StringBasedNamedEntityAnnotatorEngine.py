@@ -2,6 +2,7 @@ from typing import List
 
 import pytest
 
+from enhanced_search import configuration as config
 from enhanced_search.annotation import (
     Annotation,
     AnnotationResult,
@@ -11,6 +12,7 @@ from enhanced_search.annotation import (
 from enhanced_search.annotation.text.engines import (
     StringBasedNamedEntityAnnotatorEngine,
 )
+from enhanced_search.databases.key_value import SimpleKeyValueDatabase
 
 
 class TestStringBasedNamedEntityAnnotatorEngine:
@@ -288,3 +290,43 @@ class TestStringBasedNamedEntityAnnotatorEngine:
                 named_entity_type=NamedEntityType.PLANT,
             ),
         ]
+
+    def test_parse_with_prefix_lookup_in_database(self):
+        """Feature: Databases providing a prefix lookup stop the token extension
+        early, but still find the longest match."""
+        db = SimpleKeyValueDatabase()
+        db.parse_data(config.FALLBACK_DATABASE_DATA)
+        engine = StringBasedNamedEntityAnnotatorEngine(db)
+
+        annotation_result = AnnotationResult()
+        annotation_result.tokens = [
+            LiteralString(begin=0, end=5, text="Fagus", lemma="Fagus"),
+            LiteralString(begin=6, end=15, text="sylvatica", lemma="sylvatica"),
+            LiteralString(begin=16, end=18, text="f.", lemma="f."),
+            LiteralString(begin=19, end=26, text="pendula", lemma="pendula"),
+            LiteralString(begin=27, end=34, text="(Lodd.)", lemma="(Lodd.)"),
+            LiteralString(begin=35, end=41, text="Dippel", lemma="Dippel"),
+            LiteralString(begin=42, end=44, text="in", lemma="in"),
+            LiteralString(begin=45, end=56, text="Deutschland", lemma="Deutschland"),
+        ]
+        engine.parse("Foo", annotation_result)
+
+        assert annotation_result.named_entity_recognition == [
+            Annotation(
+                begin=0,
+                end=41,
+                text="Fagus sylvatica f. pendula (Lodd.) Dippel",
+                lemma="Fagus sylvatica f. pendula (Lodd.) Dippel",
+                named_entity_type=NamedEntityType.PLANT,
+            ),
+            Annotation(
+                begin=45,
+                end=56,
+                text="Deutschland",
+                lemma="Deutschland",
+                named_entity_type=NamedEntityType.LOCATION,
+            ),
+        ]
+        assert not db.has_keys_with_prefix(
+            "fagus sylvatica f. pendula (lodd.) dippel in"
+        )
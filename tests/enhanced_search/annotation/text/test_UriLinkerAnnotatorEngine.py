@@ -8,7 +8,9 @@ from enhanced_search.annotation import (
     Uri,
     NamedEntityType,
 )
+from enhanced_search import configuration as config
 from enhanced_search.annotation.text.engines import UriLinkerAnnotatorEngine
+from enhanced_search.databases.key_value import SimpleKeyValueDatabase
 
 
 class TestUriLinkerAnnotatorEngine:
@@ -85,3 +87,25 @@ class TestUriLinkerAnnotatorEngine:
         uri_linker_annotator_engine.parse("Foo", annotation_result)
 
         assert annotation_result.entity_linking == expected_linked_entities
+
+    def test_parse_with_batch_read(
+        self, uri_linker_annotator_engine: UriLinkerAnnotatorEngine
+    ):
+        """Feature: Databases providing `read_many` are read in a single batch,
+        with the same result as reading each Annotation on its own."""
+        annotations = [
+            Annotation(begin=0, end=5, text="Fagus", lemma="Fagus"),
+            Annotation(begin=6, end=15, text="Sylvatica", lemma=None),
+            Annotation(begin=16, end=21, text="Paris", lemma="Paris"),
+            Annotation(begin=22, end=29, text="Unknown", lemma="Unknown"),
+        ]
+        db = SimpleKeyValueDatabase(config.FALLBACK_DATABASE_DATA)
+        batch_engine = UriLinkerAnnotatorEngine(db)
+
+        batch_result = AnnotationResult(named_entity_recognition=annotations)
+        batch_engine.parse("Foo", batch_result)
+        expected_result = AnnotationResult(named_entity_recognition=annotations)
+        uri_linker_annotator_engine.parse("Foo", expected_result)
+
+        assert batch_result.entity_linking == expected_result.entity_linking
+        assert set(batch_result.entity_linking.keys()) == {"0/5", "16/21"}
@@ -18,6 +18,27 @@ class TestRedisDatabase:
         response = redis.read(query)
         assert response == expected_response
 
+    def test_sanitize_query_with_own_malicious_characters(self):
+        """Feature: Subclasses can define further characters to strip."""
+
+        class StrictRedisDatabase(RedisDatabase):
+            MALICIOUS_CHARACTERS = {":", "*"}
+
+        strict_redis = StrictRedisDatabase(url="localhost", port=6379, db_number=1)
+        redis = RedisDatabase(url="localhost", port=6379, db_number=1)
+
+        query = "some*thing:with-colon"
+        assert strict_redis.sanitize_query(query) == "somethingwith-colon"
+        assert redis.sanitize_query(query) == "some*thingwith-colon"
+
+    def test_read_many(self, redis):
+        """Feature: Read data for several keys from Redis at once."""
+        response = redis.read_many(["fagus", "unknown", "something:with-colon"])
+        assert response == ["Plant_Flora", None, "Something with colon"]
+
+    def test_read_many_without_queries(self, redis):
+        assert redis.read_many([]) == []
+
     @pytest.fixture
     def redis(self, mock_redis_server):
         redis = RedisDatabase(
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from enhanced_search.databases.key_value import SimpleKeyValueDatabase
+
+
+class TestSimpleKeyValueDatabase:
+    def test_parse_data_from_dict(self, db, data):
+        """Feature: Data can be given as dictionary."""
+        db.parse_data(data)
+        assert db.read("fagus sylvatica") == data["fagus sylvatica"]
+
+    def test_parse_data_from_json_file(self, db, data, tmp_path):
+        """Feature: Data can be read from a JSON file."""
+        json_file_path = tmp_path / "data.json"
+        json_file_path.write_text(json.dumps(data), encoding="utf-8")
+
+        db.parse_data(json_file_path)
+
+        assert db.read("blüte") == data["blüte"]
+
+    def test_parse_data_with_unsupported_type(self, db):
+        """Feature: Unsupported data types raise an error."""
+        with pytest.raises(TypeError):
+            db.parse_data([("fagus", "Plant_Flora")])
+
+    @pytest.mark.parametrize(
+        ["prefix", "expected_result"],
+        [
+            ("fagus", True),
+            ("fagus sylvatica", True),
+            ("fag", False),
+            ("fagus sylvatica in", False),
+            ("blüte", True),
+        ],
+    )
+    def test_has_keys_with_prefix(self, prefix, expected_result, db, data):
+        """Feature: Prefixes are considered word-wise."""
+        db.parse_data(data)
+        assert db.has_keys_with_prefix(prefix) == expected_result
+
+    def test_given_data_is_copied(self, data):
+        """Feature: Later changes to the given data neither affect the stored data
+        nor the prefix index."""
+        db = SimpleKeyValueDatabase(data)
+        assert db.has_keys_with_prefix("fagus")
+
+        data["quercus robur"] = {"Plant_Flora": [["https://quercus_robur", 3]]}
+
+        assert db.read("quercus robur") is None
+        assert not db.has_keys_with_prefix("quercus")
+
+        db.parse_data(data)
+
+        assert db.read("quercus robur") == data["quercus robur"]
+        assert db.has_keys_with_prefix("quercus")
+
+    @pytest.fixture
+    def db(self):
+        return SimpleKeyValueDatabase()
+
+    @pytest.fixture
+    def data(self):
+        return {
+            "fagus sylvatica": {"Plant_Flora": [["https://fagus_sylvatica", 3]]},
+            "blüte": {"Miscellaneous": [["https://flower_part", 2]]},
+        }
@@ -0,0 +1,65 @@
+import io
+import json
+import threading
+
+import pytest
+
+from enhanced_search.databases import SparqlGraphDatabase
+
+SPARQL_RESPONSE = {
+    "head": {"vars": ["taxon"]},
+    "results": {
+        "bindings": [
+            {
+                "taxon": {
+                    "type": "uri",
+                    "value": "https://www.biofid.de/ontology/fagus",
+                }
+            }
+        ]
+    },
+}
+
+
+class TestSparqlGraphDatabase:
+    def test_read(self, sparql_db, monkeypatch):
+        """Feature: The response of the SPARQL endpoint is returned as string."""
+        response_body = json.dumps(SPARQL_RESPONSE).encode("utf-8")
+        monkeypatch.setattr(
+            "SPARQLWrapper.Wrapper.urlopener",
+            lambda *args, **kwargs: DummyHttpResponse(response_body),
+        )
+
+        response_string = sparql_db.read("SELECT ?taxon WHERE {?taxon ?p ?o}")
+
+        assert json.loads(response_string) == SPARQL_RESPONSE
+
+    def test_unsupported_return_format(self):
+        """Feature: Only return formats that can be processed are accepted."""
+        with pytest.raises(ValueError):
+            SparqlGraphDatabase(url="http://localhost:3030/sparql", return_format="xml")
+
+    def test_each_thread_uses_its_own_connector(self, sparql_db):
+        """Feature: The SPARQLWrapper objects are not shared between threads."""
+        connectors = []
+        thread = threading.Thread(
+            target=lambda: connectors.append(sparql_db._get_sparql_connector())
+        )
+        thread.start()
+        thread.join()
+
+        main_thread_connector = sparql_db._get_sparql_connector()
+
+        assert main_thread_connector is sparql_db._get_sparql_connector()
+        assert main_thread_connector is not connectors[0]
+
+    @pytest.fixture
+    def sparql_db(self):
+        return SparqlGraphDatabase(url="http://localhost:3030/sparql")
+
+
+class DummyHttpResponse(io.BytesIO):
+    """Mimics the response object returned by urllib."""
+
+    def info(self) -> dict:
+        return {"content-type": "application/sparql-results+json"}
@@ -0,0 +1,44 @@
+import pytest
+
+from enhanced_search import configuration as config
+from enhanced_search.factories import DatabaseFactory
+from tests.dummies import DummyKeyValueDatabase
+
+
+class TestDatabaseFactory:
+    def test_create(self, database_factory):
+        """Feature: Create a configured database."""
+        db = database_factory.create("key-value")
+        assert isinstance(db, DummyKeyValueDatabase)
+
+    def test_create_reuses_database(self, database_factory):
+        """Feature: A database is only created once per name."""
+        db = database_factory.create("key-value")
+        assert DatabaseFactory().create("key-value") is db
+
+    def test_invalidate(self, database_factory):
+        db = database_factory.create("key-value")
+        DatabaseFactory.invalidate("key-value")
+        assert database_factory.create("key-value") is not db
+
+    def test_create_after_configuration_change(self, database_factory, monkeypatch):
+        """Feature: A changed configuration leads to a new database object."""
+        db = database_factory.create("key-value")
+        monkeypatch.setitem(
+            config.DATABASES,
+            "key-value",
+            {"class": "tests.dummies.DummyKeyValueDatabase", "foo": None},
+        )
+        monkeypatch.setattr(DummyKeyValueDatabase, "__init__", lambda self, foo: None)
+
+        assert database_factory.create("key-value") is not db
+
+    def test_create_unknown_database(self, database_factory):
+        with pytest.raises(KeyError):
+            database_factory.create("unknown")
+
+    @pytest.fixture
+    def database_factory(self):
+        DatabaseFactory.invalidate()
+        yield DatabaseFactory()
+        DatabaseFactory.invalidate()
@@ -2,6 +2,8 @@ from typing import List, Type
 
 import pytest
 
+from enhanced_search import configuration as config
+from enhanced_search.annotation import AnnotationResult, NamedEntityType
 from enhanced_search.annotation.text import AnnotationEngine, TextAnnotator
 from enhanced_search.annotation.text.engines import (
     DisambiguationAnnotationEngine,
@@ -10,7 +12,7 @@ from enhanced_search.annotation.text.engines import (
     StringBasedNamedEntityAnnotatorEngine,
     UriLinkerAnnotatorEngine,
 )
-from enhanced_search.factories import TextAnnotatorFactory
+from enhanced_search.factories import DatabaseFactory, TextAnnotatorFactory
 
 
 class TestTextAnnotatorFactory:
@@ -28,6 +30,71 @@ class TestTextAnnotatorFactory:
             ],
         )
 
+    def test_create_shares_engines(self, text_annotator_factory):
+        """Feature: The default AnnotationEngines are only created once."""
+        text_annotator = text_annotator_factory.create()
+        other_text_annotator = TextAnnotatorFactory().create()
+
+        assert (
+            text_annotator.annotation_engines
+            is not other_text_annotator.annotation_engines
+        )
+        for engine, other_engine in zip(
+            text_annotator.annotation_engines, other_text_annotator.annotation_engines
+        ):
+            assert engine is other_engine
+
+    def test_create_after_database_change(self, text_annotator_factory):
+        """Feature: The default AnnotationEngines are created anew, if the
+        key-value database changes."""
+        text_annotator = text_annotator_factory.create()
+        DatabaseFactory.invalidate("key-value")
+        other_text_annotator = text_annotator_factory.create()
+
+        assert not set(map(id, text_annotator.annotation_engines)) & set(
+            map(id, other_text_annotator.annotation_engines)
+        )
+
+    def test_create_after_fallback_data_change(
+        self, text_annotator_factory, monkeypatch
+    ):
+        """Feature: The fallback database is created anew, if the fallback data
+        is replaced."""
+        monkeypatch.delitem(config.DATABASES, "key-value")
+        DatabaseFactory.invalidate("key-value")
+
+        annotation_result = text_annotator_factory.create().annotate("Vogel")
+        assert get_named_entity_types(annotation_result) == [NamedEntityType.ANIMAL]
+
+        monkeypatch.setattr(
+            config,
+            "FALLBACK_DATABASE_DATA",
+            {"vogel": {"Plant_Flora": [["https://www.biofid.de/ontology/vogel", 3]]}},
+        )
+
+        annotation_result = text_annotator_factory.create().annotate("Vogel")
+        assert get_named_entity_types(annotation_result) == [NamedEntityType.PLANT]
+
+    def test_create_after_fallback_data_change_in_place(
+        self, text_annotator_factory, monkeypatch
+    ):
+        """Feature: The fallback database is created anew, if the fallback data
+        is changed in place."""
+        monkeypatch.delitem(config.DATABASES, "key-value")
+        DatabaseFactory.invalidate("key-value")
+
+        annotation_result = text_annotator_factory.create().annotate("Vogel")
+        assert get_named_entity_types(annotation_result) == [NamedEntityType.ANIMAL]
+
+        monkeypatch.setitem(
+            config.FALLBACK_DATABASE_DATA,
+            "vogel",
+            {"Plant_Flora": [["https://www.biofid.de/ontology/vogel", 3]]},
+        )
+
+        annotation_result = text_annotator_factory.create().annotate("Vogel")
+        assert get_named_entity_types(annotation_result) == [NamedEntityType.PLANT]
+
     @pytest.fixture(scope="session")
     def text_annotator_factory(self):
         return TextAnnotatorFactory()
@@ -46,3 +113,12 @@ def assert_has_annotation_engines(
             is_engine_in_text_annotator.append(False)
 
     assert all(is_engine_in_text_annotator)
+
+
+def get_named_entity_types(
+    annotation_result: AnnotationResult,
+) -> List[NamedEntityType]:
+    return [
+        annotation.named_entity_type
+        for annotation in annotation_result.named_entity_recognition
+    ]
@@ -361,6 +361,48 @@ class TestSolrQueryGenerator:
         generated_query = solr_query_generator.to_solr_query(query)
         assert generated_query.string == expected_solr_query
 
+    def test_to_solr_query_after_query_modification(self, solr_query_generator):
+        """Feature: Generated query strings are cached, but a modified Query
+        generates a new query string."""
+        annotation = Annotation(
+            begin=0,
+            end=5,
+            text="Fagus",
+            uris={Uri(url="https://www.biofid.de/ontology/fagus", is_safe=True)},
+        )
+        query = Query(original_string="Fagus", annotations=[annotation])
+
+        first_query = solr_query_generator.to_solr_query(query)
+        assert solr_query_generator.to_solr_query(query) == first_query
+
+        annotation.uris.add(
+            Uri(url="https://www.biofid.de/ontology/buche", is_safe=True)
+        )
+        modified_query = solr_query_generator.to_solr_query(query)
+
+        assert first_query.string == 'q:"https://www.biofid.de/ontology/fagus"'
+        assert modified_query.string == (
+            'q:("https://www.biofid.de/ontology/buche" OR '
+            '"https://www.biofid.de/ontology/fagus")'
+        )
+
+    def test_to_solr_query_without_statements(self, solr_query_generator, monkeypatch):
+        """Feature: Queries without statements skip the statement processing."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Statements were processed!")
+
+        monkeypatch.setattr(
+            solr_query_generator, "_collect_statement_search_terms", fail
+        )
+        literal = LiteralString(begin=0, end=4, text="Test")
+        query = Query(original_string="Test", literals=[literal])
+
+        generated_query = solr_query_generator.to_solr_query(query)
+
+        assert generated_query.string == "q:Test"
+        assert query.literals == [literal]
+
     @pytest.fixture
     def solr_query_generator(self):
         return SolrQueryGenerator()
@@ -127,6 +127,18 @@ class TestDataExtractionFromRequest:
                 ),
                 (True, False),
             ),
+            # Scenario - Parameter is list of booleans
+            (
+                {"flags": ["true", "False", "0", True]},
+                (
+                    {
+                        "name": "flags",
+                        "parameter_type": bool,
+                        "optional": False,
+                    },
+                ),
+                ([True, False, False, True],),
+            ),
             # Scenario - Escape function given
             (
                 {"term": "Some \\ string with intere$ting ch4racters!"},
@@ -190,6 +202,14 @@ class TestDataExtractionFromRequest:
 
         assert get_from_data(query_dict, **parameters) == expected_values
 
+    def test_get_from_data_for_missing_optional_list(self):
+        """Feature: A missing optional list parameter of a Django QueryDict
+        results in an empty list, as Django returns it."""
+        query_dict = DummyQueryDict()
+        query_dict.data = {"format": "json"}
+
+        assert get_from_data(query_dict, "term", list, optional=True) == []
+
     @pytest.mark.parametrize(
         ["request_data", "function_parameters", "expected_exception"],
         [
@@ -277,5 +297,10 @@ class DummyQueryDict:
         return self.data.get(key, default)
 
     def getlist(self, key: str, default: Any = None) -> list[Any]:
-        """A mock function for the QueryDict method of the same name."""
-        return self.data.get(key, default)
+        """A mock function for the QueryDict method of the same name.
+        Like Django, an empty list is returned for a missing key by default.
+        """
+        if key not in self.data:
+            return [] if default is None else default
+
+        return self.data[key]
@@ -0,0 +1,21 @@
+import pytest
+
+from enhanced_search.utils import escape_characters
+
+
+class TestEscapeCharacters:
+    @pytest.mark.parametrize(
+        ["text", "characters", "expected_output"],
+        [
+            ("Das ist ein Test", ["!"], "Das ist ein Test"),
+            ("Das ist ein Test!", ["!"], "Das ist ein Test\\!"),
+            ("a\\b:c", {"\\", ":"}, "a\\\\b\\:c"),
+            ("a-b", "-", "a\\-b"),
+            ("a-b", [], "a-b"),
+            # Scenario - Items that are not a single character are ignored
+            ("a-b", ["-", "\\-"], "a\\-b"),
+            ("a-b", ["a-b", ""], "a-b"),
+        ],
+    )
+    def test_escape_characters(self, text, characters, expected_output):
+        assert escape_characters(text, characters) == expected_output